@@ -5,9 +5,8 @@ Uses environment variables with pydantic for validation.
 
 import os
 from pathlib import Path
-from typing import Optional
-from functools import lru_cache
-from pydantic import ConfigDict
+from typing import Optional, Set
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,8 +21,12 @@ class Settings(BaseSettings):
     SEC_RATE_LIMIT_SECONDS: float = 0.1  # 10 requests per second
     NASDAQ_RATE_LIMIT_SECONDS: float = 1.0  # Conservative default
     MAX_CONCURRENT_REQUESTS: int = 5  # Maximum concurrent HTTP requests
+    NASDAQ_CONCURRENCY: int = 5  # Earnings calendar dates fetched at once
     MAX_RETRIES: int = 5  # Maximum number of retry attempts
     REQUEST_TIMEOUT_SECONDS: int = 15  # Request timeout in seconds
+    TARGET_LATENCY_SECONDS: float = 2.0  # Grow concurrency while below this
+    CIRCUIT_BREAKER_THRESHOLD: int = 5  # Consecutive overloads before tripping
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: float = 30.0  # Fail fast for this long
 
     # Database
     DATABASE_URL: Optional[str] = None
@@ -34,31 +37,40 @@ class Settings(BaseSettings):
 
     # Scraping Configuration
     RETRY_BACKOFF_FACTOR: float = 2.0
+    SUMMARY_CACHE_TTL_SECONDS: float = 300.0  # Reuse earnings summaries this long
 
-    # Path Configuration - Set as properties for better testing
-    @property
+    # Path Configuration - Resolved once per Settings instance; tests pick up
+    # a new BASE_DATA_DIR through reset_settings()
+    @cached_property
     def BASE_DATA_DIR(self) -> Path:
         return Path(os.getenv("BASE_DATA_DIR", "data"))
 
-    @property
+    @cached_property
     def RAW_DATA_DIR(self) -> Path:
         return self.BASE_DATA_DIR / "raw"
 
-    @property
+    @cached_property
     def PROCESSED_DATA_DIR(self) -> Path:
         return self.BASE_DATA_DIR / "processed"
 
-    @property
+    @cached_property
     def LOG_DIR(self) -> Path:
         return self.BASE_DATA_DIR / "logs"
 
+    # Settings are read-only after load; frozen also makes them hashable
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
     )
 
     def create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        directories = [
+        base_dir = self.BASE_DATA_DIR
+        leaves = [
             self.RAW_DATA_DIR / "sec",
             self.RAW_DATA_DIR / "nasdaq",
             self.PROCESSED_DATA_DIR / "companies",
@@ -66,27 +78,37 @@ class Settings(BaseSettings):
             self.PROCESSED_DATA_DIR / "earnings" / "master",
             self.LOG_DIR,
         ]
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
 
+        # Expand leaves into their ancestors below the base directory so
+        # shared prefixes are created once, shallowest first
+        directories: Set[Path] = set()
+        for leaf in leaves:
+            directories.add(leaf)
+            directories.update(p for p in leaf.parents if base_dir in p.parents)
 
-# Global settings instance
-_settings: Optional[Settings] = None
+        base_dir.mkdir(parents=True, exist_ok=True)
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
 
 
-@lru_cache()
+# Data roots whose directory tree has already been created in this process
+_created_data_dirs: Set[Path] = set()
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    global _settings
-    if _settings is None:
-        env_file = "test.env" if os.getenv("TESTING") else ".env"
-        _settings = Settings(_env_file=env_file)
-        _settings.create_directories()
-    return _settings
+    env_file = "test.env" if os.getenv("TESTING") else ".env"
+    settings = Settings(_env_file=env_file)
+    if settings.BASE_DATA_DIR not in _created_data_dirs:
+        settings.create_directories()
+        _created_data_dirs.add(settings.BASE_DATA_DIR)
+    return settings
 
 
 def reset_settings() -> None:
     """Reset settings - useful for testing."""
-    global _settings
-    _settings = None
     get_settings.cache_clear()
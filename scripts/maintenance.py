@@ -4,30 +4,31 @@ Maintenance script for the SEC earnings scraper database.
 
 import asyncio
 import argparse
-from datetime import datetime, timedelta
-from pathlib import Path
+import os
+from datetime import date, datetime, timedelta
 import sys
-from typing import Set, List
+from typing import TYPE_CHECKING, List, Set, Tuple
 
 # Add src directory to Python path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.clients.sec_client import SECClient
-from src.clients.nasdaq_client import NASDAQClient
-from src.services.cik_service import CIKService
-from src.services.earnings_service import EarningsService
-from src.repositories.csv_repository import CSVRepository
-from src.repositories.earnings_repository import EarningsRepository
-from src.models.company import Company
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from src.utils.logging_utils import setup_logger
 from config.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.models.earnings import EarningsReport
+    from src.services.cik_service import CIKService
+    from src.services.earnings_service import EarningsService
+
 settings = get_settings()
 logger = setup_logger(__name__)
 
+_CIK_PATTERN = r"[0-9]{10}"
+_STALE_AFTER = timedelta(days=7)
+
 
 async def validate_data_integrity(
-    cik_service: CIKService, earnings_service: EarningsService
+    cik_service: "CIKService", earnings_service: "EarningsService"
 ) -> List[str]:
     """
     Validate data integrity across the database.
@@ -39,7 +40,10 @@ async def validate_data_integrity(
     Returns:
         List[str]: List of integrity issues found
     """
+    import pandas as pd
+
     issues = []
+    now = datetime.now()
 
     try:
         # Check company data
@@ -47,25 +51,35 @@ async def validate_data_integrity(
         if not companies:
             issues.append("No active companies found in database")
 
-        # Validate CIK formats
-        invalid_ciks = [
-            company.symbol
-            for company in companies
-            if not company.cik.isdigit() or len(company.cik) != 10
-        ]
+        # Validate CIK formats as one column-wise mask
+        company_df = pd.DataFrame(
+            {
+                "cik": [company.cik for company in companies],
+                "symbol": [company.symbol for company in companies],
+            },
+            dtype=str,
+        )
+        invalid_ciks = company_df.loc[
+            ~company_df["cik"].str.fullmatch(_CIK_PATTERN), "symbol"
+        ].tolist()
+
         if invalid_ciks:
             issues.append(f"Invalid CIK format for symbols: {', '.join(invalid_ciks)}")
 
         # Check for duplicate symbols
-        symbols = [company.symbol for company in companies]
-        if len(symbols) != len(set(symbols)):
-            issues.append("Duplicate symbols found in company database")
+        symbols = company_df["symbol"]
+        duplicate_symbols = symbols[symbols.duplicated()].unique().tolist()
+        if duplicate_symbols:
+            issues.append(
+                "Duplicate symbols found in company database: "
+                f"{', '.join(duplicate_symbols)}"
+            )
 
         # Check earnings data
         latest_date = await earnings_service.repository.get_latest_report_date()
         if not latest_date:
             issues.append("No earnings data found")
-        elif latest_date < datetime.now() - timedelta(days=7):
+        elif latest_date < now - _STALE_AFTER:
             issues.append(
                 f"Earnings data may be stale. Latest date: {latest_date.date()}"
             )
@@ -78,7 +92,7 @@ async def validate_data_integrity(
         return issues
 
 
-async def clean_duplicate_data(earnings_service: EarningsService) -> int:
+async def clean_duplicate_data(earnings_service: "EarningsService") -> int:
     """
     Remove duplicate earnings reports.
 
@@ -90,31 +104,31 @@ async def clean_duplicate_data(earnings_service: EarningsService) -> int:
     """
     try:
         repository = earnings_service.repository
-        all_reports = await repository.get_all()
-
-        # Track unique reports by composite key
-        seen_reports = set()
-        duplicates = []
 
-        for report in all_reports:
+        # Keep the first report seen for each composite key
+        seen: Set[Tuple[str, datetime]] = set()
+        unique_reports: List["EarningsReport"] = []
+        total = 0
+        async for report in repository.iter_all():
+            total += 1
             key = (report.symbol, report.report_date)
-            if key in seen_reports:
-                duplicates.append(report)
-            else:
-                seen_reports.add(key)
+            if key not in seen:
+                seen.add(key)
+                unique_reports.append(report)
 
-        # Remove duplicates
-        for report in duplicates:
-            await repository.delete(report.symbol)
+        # Rewrite the master file once instead of deleting row by row
+        removed = total - len(unique_reports)
+        if removed:
+            await repository.replace_all(unique_reports)
 
-        return len(duplicates)
+        return removed
 
     except Exception as e:
         logger.error(f"Failed to clean duplicate data: {str(e)}", exc_info=True)
         raise
 
 
-async def rebuild_daily_files(earnings_service: EarningsService) -> int:
+async def rebuild_daily_files(earnings_service: "EarningsService") -> int:
     """
     Rebuild daily earnings files from master data.
 
@@ -126,23 +140,19 @@ async def rebuild_daily_files(earnings_service: EarningsService) -> int:
     """
     try:
         repository = earnings_service.repository
-        all_reports = await repository.get_all()
 
-        # Group reports by date
-        reports_by_date = {}
-        for report in all_reports:
-            date = report.report_date.date()
-            if date not in reports_by_date:
-                reports_by_date[date] = []
-            reports_by_date[date].append(report)
+        import pandas as pd
 
-        # Rebuild daily files
-        for date, reports in reports_by_date.items():
-            date_datetime = datetime.combine(date, datetime.min.time())
-            for report in reports:
-                await repository.add_daily_report(date_datetime, report)
+        # Stream the master file and flush each chunk's days to their daily
+        # files, appending when a day spans more than one chunk
+        written: Set[date] = set()
+        async for chunk in repository.iter_frames():
+            report_days = pd.to_datetime(chunk["report_date"]).dt.date
+            for day, group in chunk.groupby(report_days, sort=True):
+                await repository.write_daily_batch(day, group, append=day in written)
+                written.add(day)
 
-        return len(reports_by_date)
+        return len(written)
 
     except Exception as e:
         logger.error(f"Failed to rebuild daily files: {str(e)}", exc_info=True)
@@ -172,6 +182,15 @@ async def main() -> None:
     """Main execution function."""
     args = parse_args()
 
+    # Deferred so argument errors and --help don't pay for aiohttp and pandas
+    from src.clients.nasdaq_client import NASDAQClient
+    from src.clients.sec_client import SECClient
+    from src.models.company import Company
+    from src.repositories.csv_repository import CSVRepository
+    from src.repositories.earnings_repository import EarningsRepository
+    from src.services.cik_service import CIKService
+    from src.services.earnings_service import EarningsService
+
     try:
         # Initialize services
         sec_client = SECClient()
@@ -219,4 +238,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when installed (pip install .[speed])
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,36 +4,49 @@ Main script for running the SEC earnings scraper.
 
 import asyncio
 import argparse
+import os
 from datetime import datetime, timedelta
-from pathlib import Path
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # Add src directory to Python path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.clients.sec_client import SECClient
-from src.clients.nasdaq_client import NASDAQClient
-from src.services.cik_service import CIKService
-from src.services.earnings_service import EarningsService
-from src.repositories.csv_repository import CSVRepository
-from src.repositories.earnings_repository import EarningsRepository
-from src.models.company import Company
-from src.utils.date_utils import TradingCalendar
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from src.utils.logging_utils import setup_logger
 from config.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.services.cik_service import CIKService
+    from src.services.earnings_service import EarningsService
+
 settings = get_settings()
 logger = setup_logger(__name__)
 
+# Services shared by runs on the same event loop; their sessions, locks and
+# conditions are bound to the loop they were created on
+_services: Optional[tuple["CIKService", "EarningsService"]] = None
+_services_loop: Optional[asyncio.AbstractEventLoop] = None
 
-async def initialize_services() -> tuple[CIKService, EarningsService]:
+
+async def _build_services() -> tuple["CIKService", "EarningsService"]:
     """
-    Initialize all required services and their dependencies.
+    Construct all required services and their dependencies.
+
+    The client, repository and service modules pull in aiohttp and pandas,
+    so they are imported here rather than at module load to keep
+    ``--help`` and argument errors fast.
 
     Returns:
         tuple[CIKService, EarningsService]: Initialized services
     """
+    from src.clients.nasdaq_client import NASDAQClient
+    from src.clients.sec_client import SECClient
+    from src.models.company import Company
+    from src.repositories.csv_repository import CSVRepository
+    from src.repositories.earnings_repository import EarningsRepository
+    from src.services.cik_service import CIKService
+    from src.services.earnings_service import EarningsService
+
     # Initialize clients
     sec_client = SECClient()
     nasdaq_client = NASDAQClient()
@@ -53,7 +66,26 @@ async def initialize_services() -> tuple[CIKService, EarningsService]:
     return cik_service, earnings_service
 
 
-async def update_company_data(cik_service: CIKService) -> None:
+async def initialize_services() -> tuple["CIKService", "EarningsService"]:
+    """
+    Initialize all required services and their dependencies.
+
+    Services are built on the first call and reused while the same event
+    loop is running; a new loop (e.g. another ``asyncio.run``) gets fresh
+    services.
+
+    Returns:
+        tuple[CIKService, EarningsService]: Initialized services
+    """
+    global _services, _services_loop
+    loop = asyncio.get_running_loop()
+    if _services is None or _services_loop is not loop:
+        _services = await _build_services()
+        _services_loop = loop
+    return _services
+
+
+async def update_company_data(cik_service: "CIKService") -> None:
     """
     Update company CIK data from SEC.
 
@@ -74,7 +106,7 @@ async def update_company_data(cik_service: CIKService) -> None:
 
 
 async def update_earnings_data(
-    earnings_service: EarningsService,
+    earnings_service: "EarningsService",
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     days_back: int = 30,
@@ -88,6 +120,8 @@ async def update_earnings_data(
         end_date: Optional end date
         days_back: Days to look back if no start date
     """
+    import pandas as pd
+
     # Determine date range
     end_date = end_date or datetime.now()
     start_date = start_date or (end_date - timedelta(days=days_back))
@@ -103,10 +137,12 @@ async def update_earnings_data(
             f"across {processed_dates} dates"
         )
 
-        # Log dates with no data
-        no_data_dates = [
-            date.strftime("%Y-%m-%d") for date, count in results.items() if count == 0
-        ]
+        # Log dates with no data, formatted in one vectorized call
+        no_data_dates = (
+            pd.DatetimeIndex([date for date, count in results.items() if count == 0])
+            .strftime("%Y-%m-%d")
+            .tolist()
+        )
         if no_data_dates:
             logger.warning(f"No data found for dates: {', '.join(no_data_dates)}")
 
@@ -115,19 +151,42 @@ async def update_earnings_data(
         raise
 
 
+def parse_date_arg(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD command line date.
+
+    Args:
+        value: Raw argument value
+
+    Returns:
+        datetime: Parsed date at midnight
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a YYYY-MM-DD date
+    """
+    try:
+        if len(value) != 10:
+            raise ValueError(value)
+        return datetime.fromisoformat(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"Invalid date (expected YYYY-MM-DD): {value}"
+        ) from e
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="SEC Earnings Data Scraper")
 
     parser.add_argument(
         "--start-date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+        type=parse_date_arg,
         help="Start date (YYYY-MM-DD)",
     )
 
     parser.add_argument(
         "--end-date",
-        type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+        type=parse_date_arg,
         help="End date (YYYY-MM-DD)",
     )
 
@@ -153,16 +212,21 @@ async def main() -> None:
         # Initialize services
         cik_service, earnings_service = await initialize_services()
 
-        # Update company data if not skipped
+        # Company and earnings updates hit different APIs, so run them
+        # together. The company update is scheduled first and holds the CIK
+        # cache until it finishes, so earnings CIK lookups see the new list.
+        updates = []
         if not args.skip_company_update:
             logger.info("Updating company data...")
-            await update_company_data(cik_service)
+            updates.append(update_company_data(cik_service))
 
-        # Update earnings data
         logger.info("Updating earnings data...")
-        await update_earnings_data(
-            earnings_service, args.start_date, args.end_date, args.days_back
+        updates.append(
+            update_earnings_data(
+                earnings_service, args.start_date, args.end_date, args.days_back
+            )
         )
+        await asyncio.gather(*updates)
 
         logger.info("Scraping completed successfully")
 
@@ -172,4 +236,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when installed (pip install .[speed])
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,10 +3,9 @@ Test script to verify configuration and basic functionality.
 """
 
 import asyncio
+import logging
 import sys
 import os
-import pandas as pd
-from pathlib import Path
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 
@@ -14,7 +13,7 @@ from contextlib import asynccontextmanager
 os.environ["TESTING"] = "true"
 
 # Add project root to Python path
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.clients.sec_client import SECClient
 from src.clients.nasdaq_client import NASDAQClient
@@ -92,8 +91,7 @@ async def test_company_repository():
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create fresh repository for test
-    if file_path.exists():
-        file_path.unlink()
+    file_path.unlink(missing_ok=True)
 
     repository = CSVRepository(
         file_path=file_path, model_class=Company, key_field="cik"
@@ -118,11 +116,10 @@ async def test_company_repository():
         logger.info("Added company to repository")
 
         # Debug: Check raw CSV content
-        if file_path.exists():
-            df = pd.read_csv(file_path)
-            logger.info(f"CSV content after add:\n{df.to_string()}")
-        else:
+        if not file_path.exists():
             logger.error("CSV file doesn't exist after add!")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CSV content after add:\n%s", file_path.read_text())
 
         # Test retrieve
         retrieved = await repository.get("0000320193")
@@ -131,8 +128,7 @@ async def test_company_repository():
         else:
             logger.error("Failed to retrieve company")
             if file_path.exists():
-                df = pd.read_csv(file_path)
-                logger.error(f"Current CSV content:\n{df.to_string()}")
+                logger.error("Current CSV content:\n%s", file_path.read_text())
             return False
 
         # Verify all fields match
@@ -168,12 +164,10 @@ async def main():
         # Test directory structure
         struct_ok = await test_directory_structure()
 
-        # Test API clients
-        sec_ok = await test_sec_client()
-        nasdaq_ok = await test_nasdaq_client()
-
-        # Test repository
-        repo_ok = await test_company_repository()
+        # Test API clients and repository concurrently
+        sec_ok, nasdaq_ok, repo_ok = await asyncio.gather(
+            test_sec_client(), test_nasdaq_client(), test_company_repository()
+        )
 
         # Report results
         logger.info("\nTest Results:")
@@ -190,13 +184,13 @@ async def main():
     except Exception as e:
         logger.error(f"Setup test failed: {str(e)}")
         sys.exit(1)
-    finally:
-        # Ensure we cleanup any pending tasks
-        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when installed (pip install .[speed])
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,27 +3,107 @@ Base HTTP client with advanced error handling and retry logic.
 """
 
 import asyncio
-from typing import Any, Dict, Optional, cast
-
-from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
+import random
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+import orjson
+from aiohttp import (
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
 )
 
 from config.settings import get_settings
-from src.utils.exceptions import APIError, RateLimitError
+from src.utils.exceptions import APIError, CircuitOpenError, RateLimitError
 from src.utils.logging_utils import setup_logger
 
 settings = get_settings()
 logger = setup_logger(__name__)
 
+# Target length of the sliding rate limit window in seconds; clients slower
+# than one request per window stretch it so the configured rate still holds
+RATE_LIMIT_WINDOW_SECONDS = 1.0
+
+# Number of recent request latencies averaged by the concurrency controller
+LATENCY_SAMPLE_SIZE = 20
+
+# Upper bound of the random delay added to server-requested retry waits
+RETRY_JITTER_SECONDS = 1.0
+
+# Most GET bodies kept for conditional requests, least recently used dropped
+VALIDATOR_CACHE_SIZE = 32
+
+# Conditional-GET cache key: request URL plus its sorted query params
+ValidatorKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+ValidatorEntry = Tuple[Optional[str], Optional[str], Dict[str, Any]]
+
+T = TypeVar("T")
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given as seconds or as an HTTP date.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(error: APIError, attempt: int) -> float:
+    """
+    Wait as long as the server asked for, falling back to exponential backoff.
+
+    Args:
+        error: Error raised by the failed attempt
+        attempt: Number of attempts made so far, starting at 1
+
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    if isinstance(error, RateLimitError) and error.retry_after is not None:
+        return error.retry_after + random.uniform(0, RETRY_JITTER_SECONDS)
+    backoff = settings.RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1)
+    return min(60.0, max(1.0, backoff))
+
 
 class BaseAPIClient:
     """Base class for API clients with built-in retry and error handling."""
 
+    # Endpoints whose GET bodies are kept for If-None-Match/If-Modified-Since
+    CONDITIONAL_ENDPOINTS: FrozenSet[str] = frozenset()
+
     def __init__(
         self,
         base_url: str,
@@ -36,14 +116,56 @@ class BaseAPIClient:
         Args:
             base_url: Base URL for API requests
             headers: Optional headers to include in all requests
-            rate_limit_seconds: Minimum time between requests
+            rate_limit_seconds: Average time between request starts; up to
+                one window's worth of requests may start back to back
         """
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.headers = headers or {}
         self.rate_limit_seconds = rate_limit_seconds
-        self._last_request_time: float = 0
+        # Round down and size the window to fit, so a burst never exceeds
+        # one request per rate_limit_seconds on average
+        interval = max(rate_limit_seconds, 1e-3)
+        self._window_limit = max(1, int(RATE_LIMIT_WINDOW_SECONDS / interval + 1e-9))
+        self._window_seconds = self._window_limit * interval
+        # Start times of requests admitted in the current window
+        self._window: Deque[float] = deque()
+        self._paused_until: float = 0
         self._session: Optional[ClientSession] = None
-        self._lock = asyncio.Lock()
+
+        # Adaptive concurrency: additive increase, multiplicative decrease
+        self._concurrency = float(settings.MAX_CONCURRENT_REQUESTS)
+        self._in_flight = 0
+        self._capacity = asyncio.Condition()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._consecutive_overloads = 0
+        self._circuit_open_until: float = 0
+
+        # GET requests currently in flight, keyed by endpoint and params
+        self._inflight: Dict[
+            Tuple[str, Tuple[Any, ...]], "asyncio.Future[Dict[str, Any]]"
+        ] = {}
+
+        # GET responses for CONDITIONAL_ENDPOINTS keyed by URL and params:
+        # (ETag, Last-Modified, parsed body)
+        self._validator_cache: "OrderedDict[ValidatorKey, ValidatorEntry]" = (
+            OrderedDict()
+        )
+
+    def _validator_key(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> ValidatorKey:
+        """
+        Build the conditional-GET cache key for a request.
+
+        Args:
+            path: Endpoint path relative to the base URL
+            params: Query parameters, if any
+
+        Returns:
+            ValidatorKey: Full URL and params sorted by name
+        """
+        return self._url_prefix + path, tuple(sorted((params or {}).items()))
 
     async def __aenter__(self) -> "BaseAPIClient":
         """Set up async context manager."""
@@ -58,8 +180,14 @@ class BaseAPIClient:
         """Set up the API client session."""
         if self._session is None:
             timeout = ClientTimeout(total=settings.REQUEST_TIMEOUT_SECONDS)
+            # Keep connections alive so repeated calls to the same host skip
+            # the TCP and TLS handshakes
             connector = TCPConnector(
-                limit=settings.MAX_CONCURRENT_REQUESTS, force_close=True
+                limit=settings.MAX_CONCURRENT_REQUESTS,
+                limit_per_host=settings.MAX_CONCURRENT_REQUESTS,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
             )
             self._session = ClientSession(
                 connector=connector,
@@ -74,12 +202,6 @@ class BaseAPIClient:
             await self._session.close()
             self._session = None
 
-    @retry(
-        stop=stop_after_attempt(settings.MAX_RETRIES),
-        wait=wait_exponential(multiplier=settings.RETRY_BACKOFF_FACTOR, min=1, max=60),
-        retry=retry_if_exception_type(APIError),
-        reraise=True,
-    )
     async def _make_request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -97,19 +219,118 @@ class BaseAPIClient:
         Raises:
             APIError: If the request fails
             RateLimitError: If rate limit is exceeded
+            CircuitOpenError: If the circuit breaker is open
+        """
+        return await self._with_retries(
+            lambda: self._send_request(method, endpoint, **kwargs)
+        )
+
+    async def _with_retries(self, attempt_request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run request attempts until one succeeds or retries run out.
+
+        Failed attempts raising APIError are retried up to MAX_RETRIES
+        attempts in total, read from settings on every call. An open circuit
+        fails fast instead of retrying until the cooldown ends.
+
+        Args:
+            attempt_request: Makes one request attempt
+
+        Returns:
+            T: Result of the first successful attempt
+
+        Raises:
+            APIError: If the last attempt fails
+            CircuitOpenError: If the circuit breaker is open
+        """
+        attempt = 0
+        while True:
+            try:
+                return await attempt_request()
+            except CircuitOpenError:
+                raise
+            except APIError as e:
+                attempt += 1
+                if attempt >= settings.MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_retry_delay(e, attempt))
+
+    async def _send_request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Make a single HTTP request attempt.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            **kwargs: Additional arguments for the request
+
+        Returns:
+            Dict[str, Any]: Parsed response data
+
+        Raises:
+            APIError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            CircuitOpenError: If the circuit breaker is open
+        """
+        path = endpoint.lstrip("/") if endpoint.startswith("/") else endpoint
+        cache_key = (
+            self._validator_key(path, kwargs.get("params"))
+            if method == "GET" and path in self.CONDITIONAL_ENDPOINTS
+            else None
+        )
+        cached = self._add_conditional_headers(cache_key, kwargs)
+
+        return await self._request(
+            method,
+            self._url_prefix + path,
+            lambda response: self._read_response(cache_key, response, cached),
+            **kwargs,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        read: Callable[[ClientResponse], Awaitable[T]],
+        **kwargs: Any,
+    ) -> T:
+        """
+        Send one request under the circuit breaker, concurrency and rate limits.
+
+        Every request path goes through here, so each one is accounted for by
+        the concurrency controller and can trip the circuit.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full request URL
+            read: Turns the response into the result while it is still open
+            **kwargs: Additional arguments for the request
+
+        Returns:
+            T: Result of ``read``
+
+        Raises:
+            APIError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            CircuitOpenError: If the circuit breaker is open
         """
         if self._session is None:
             await self.setup()
 
         assert self._session is not None
 
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._circuit_open_until:
+            raise CircuitOpenError(
+                f"Circuit open for {self.base_url}; request to {url} skipped"
+            )
 
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-            time_since_last_request = now - self._last_request_time
-            if time_since_last_request < self.rate_limit_seconds:
-                await asyncio.sleep(self.rate_limit_seconds - time_since_last_request)
+        await self._acquire_capacity()
+        try:
+            await self._wait_for_slot()
+            started = loop.time()
 
             try:
                 async with self._session.request(
@@ -117,24 +338,225 @@ class BaseAPIClient:
                     url,
                     **kwargs,
                 ) as response:
-                    self._last_request_time = asyncio.get_event_loop().time()
-
-                    if response.status == 429:
-                        raise RateLimitError(
-                            "Rate limit exceeded",
-                            status_code=429,
-                            response_body=await response.text(),
-                        )
-
-                    return await self._handle_response(response)
+                    data = await read(response)
 
+            except RateLimitError as e:
+                self._record_failure(e)
+                raise
+            except ClientResponseError as e:
+                self._record_failure(e)
+                if e.status == 429:
+                    raise RateLimitError(
+                        f"Rate limit exceeded for {url}",
+                        status_code=429,
+                        original_error=e,
+                        retry_after=_parse_retry_after(
+                            e.headers.get("Retry-After") if e.headers else None
+                        ),
+                    ) from e
+                logger.error(f"Request failed: {str(e)}", exc_info=True)
+                raise APIError(
+                    f"Request to {url} failed: {str(e)}", status_code=e.status
+                ) from e
             except asyncio.TimeoutError as e:
+                self._record_failure(e)
                 logger.error(f"Request timeout: {str(e)}")
                 raise APIError(f"Request to {url} timed out") from e
             except Exception as e:
+                self._record_failure(e)
                 logger.error(f"Request failed: {str(e)}", exc_info=True)
                 raise APIError(f"Request to {url} failed: {str(e)}") from e
 
+            self._record_success(loop.time() - started)
+            return data
+        finally:
+            await self._release_capacity()
+
+    def _add_conditional_headers(
+        self, cache_key: Optional[ValidatorKey], kwargs: Dict[str, Any]
+    ) -> Optional[ValidatorEntry]:
+        """
+        Add If-None-Match/If-Modified-Since for a GET we have a cached body for.
+
+        Args:
+            cache_key: Validator cache key, or None if the request is not cached
+            kwargs: Request keyword arguments, updated in place
+
+        Returns:
+            The cached entry, if any
+        """
+        cached = None if cache_key is None else self._validator_cache.get(cache_key)
+        if cached is not None:
+            self._validator_cache.move_to_end(cache_key)
+            etag, last_modified, _ = cached
+            headers = dict(kwargs.pop("headers", None) or {})
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            kwargs["headers"] = headers
+        return cached
+
+    async def _read_response(
+        self,
+        cache_key: Optional[ValidatorKey],
+        response: ClientResponse,
+        cached: Optional[ValidatorEntry],
+    ) -> Dict[str, Any]:
+        """
+        Turn a response into data, serving 304s from the validator cache.
+
+        Args:
+            cache_key: Validator cache key, or None if the request is not cached
+            response: API response object
+            cached: Cached entry sent as conditional headers, if any
+
+        Returns:
+            Dict[str, Any]: Parsed response data
+
+        Raises:
+            RateLimitError: If the server answered 429
+            APIError: If response validation fails
+        """
+        self._track_rate_limit_headers(response)
+
+        if response.status == 429:
+            raise RateLimitError(
+                "Rate limit exceeded",
+                status_code=429,
+                response_body=await response.text(),
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        if response.status == 304 and cached is not None:
+            return cached[2]
+
+        data = await self._handle_response(response)
+        if cache_key is not None:
+            self._remember_validators(cache_key, response, data)
+        return data
+
+    def _remember_validators(
+        self, cache_key: ValidatorKey, response: ClientResponse, data: Dict[str, Any]
+    ) -> None:
+        """
+        Keep a GET body for conditional requests if the server sent validators.
+
+        Args:
+            cache_key: Validator cache key
+            response: API response object
+            data: Parsed response data
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validator_cache[cache_key] = (etag, last_modified, data)
+            self._validator_cache.move_to_end(cache_key)
+            while len(self._validator_cache) > VALIDATOR_CACHE_SIZE:
+                self._validator_cache.popitem(last=False)
+
+    async def _acquire_capacity(self) -> None:
+        """Wait for a free slot under the current concurrency limit."""
+        async with self._capacity:
+            await self._capacity.wait_for(
+                lambda: self._in_flight < int(self._concurrency)
+            )
+            self._in_flight += 1
+
+    async def _release_capacity(self) -> None:
+        """Return a concurrency slot and wake waiting requests."""
+        async with self._capacity:
+            self._in_flight -= 1
+            self._capacity.notify_all()
+
+    def _record_success(self, latency: float) -> None:
+        """
+        Grow the concurrency limit while latency stays under target.
+
+        Args:
+            latency: Duration of the completed request in seconds
+        """
+        self._consecutive_overloads = 0
+        self._latencies.append(latency)
+        mean_latency = sum(self._latencies) / len(self._latencies)
+        if mean_latency <= settings.TARGET_LATENCY_SECONDS:
+            self._concurrency = min(
+                float(settings.MAX_CONCURRENT_REQUESTS), self._concurrency + 0.5
+            )
+
+    def _record_failure(self, error: Exception) -> None:
+        """
+        Back off after an overload signal and trip the circuit if it persists.
+
+        Only rate limiting, server errors and timeouts count as overload;
+        client errors such as 404 leave the controller untouched.
+
+        Args:
+            error: Exception raised by the request
+        """
+        overloaded = isinstance(error, (asyncio.TimeoutError, RateLimitError)) or (
+            isinstance(error, ClientResponseError)
+            and (error.status == 429 or error.status >= 500)
+        )
+        if not overloaded:
+            return
+
+        self._concurrency = max(1.0, self._concurrency / 2)
+        self._consecutive_overloads += 1
+        if self._consecutive_overloads >= settings.CIRCUIT_BREAKER_THRESHOLD:
+            self._consecutive_overloads = 0
+            self._circuit_open_until = (
+                asyncio.get_running_loop().time()
+                + settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+            )
+            logger.warning(
+                f"Circuit opened for {self.base_url} after repeated overload; "
+                f"cooling down for {settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS}s"
+            )
+
+    async def _wait_for_slot(self) -> None:
+        """
+        Wait until this request may start under the rate limit.
+
+        Admits up to ``_window_limit`` request starts per sliding window of
+        ``_window_seconds``. No
+        lock is needed: checking and claiming a slot happens without an await
+        in between, so no other coroutine can interleave.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            cutoff = now - self._window_seconds
+            while self._window and self._window[0] <= cutoff:
+                self._window.popleft()
+
+            delay = self._paused_until - now
+            if len(self._window) >= self._window_limit:
+                delay = max(delay, self._window[0] - cutoff)
+            if delay <= 0:
+                self._window.append(now)
+                return
+
+            await asyncio.sleep(delay)
+
+    def _track_rate_limit_headers(self, response: ClientResponse) -> None:
+        """
+        Pause admissions when the server reports an exhausted budget.
+
+        Args:
+            response: API response object
+        """
+        headers = response.headers
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if headers.get("X-RateLimit-Remaining") == "0":
+            retry_after = max(retry_after or 0.0, RATE_LIMIT_WINDOW_SECONDS)
+        if retry_after is None:
+            return
+
+        # Only read the clock when there is something to record
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + retry_after)
+
     async def _handle_response(self, response: ClientResponse) -> Dict[str, Any]:
         """
         Handle API response and perform necessary validation.
@@ -149,7 +571,7 @@ class BaseAPIClient:
             APIError: If response validation fails
         """
         try:
-            data = await response.json()
+            data = orjson.loads(await response.read())
             return cast(Dict[str, Any], data)
         except ValueError as e:
             raise APIError(
@@ -159,7 +581,21 @@ class BaseAPIClient:
             ) from e
 
     async def get(self, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
-        return await self._make_request("GET", endpoint, **kwargs)
+        # Concurrent identical GETs share one request; anything beyond query
+        # params (headers, body, ...) opts out of sharing
+        if set(kwargs) - {"params"}:
+            return await self._make_request("GET", endpoint, **kwargs)
+
+        params = kwargs.get("params") or {}
+        key = (endpoint, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._make_request("GET", endpoint, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
 
     async def post(self, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
         return await self._make_request("POST", endpoint, **kwargs)
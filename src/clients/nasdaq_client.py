@@ -1,7 +1,9 @@
 """NASDAQ API client implementation."""
 
+import asyncio
 import os
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, cast
 
 from config.settings import get_settings
@@ -13,6 +15,25 @@ settings = get_settings()
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _mock_earnings_payload(date_: date) -> Dict[str, Any]:
+    """Build the test-mode calendar payload for a date; shared, do not mutate."""
+    return {
+        "data": {
+            "rows": [
+                {
+                    "symbol": "AAPL",
+                    "name": "Apple Inc.",
+                    "eps_estimate": "1.43",
+                    "eps_actual": "1.52",
+                    "time": "AMC",
+                    "date": date_.strftime("%Y-%m-%d"),
+                }
+            ]
+        }
+    }
+
+
 class NASDAQClient(BaseAPIClient):
     """Client for interacting with NASDAQ APIs."""
 
@@ -28,25 +49,13 @@ class NASDAQClient(BaseAPIClient):
         )
         self.trading_calendar = TradingCalendar()
         self.is_test = bool(os.getenv("TESTING", False))
+        self._symbol_validity: Dict[str, bool] = {}
         if settings.NASDAQ_API_KEY:
             self.headers["Authorization"] = f"Bearer {settings.NASDAQ_API_KEY}"
 
     def _get_mock_data(self, date_: date) -> Dict[str, Any]:
         """Get mock data for testing."""
-        return {
-            "data": {
-                "rows": [
-                    {
-                        "symbol": "AAPL",
-                        "name": "Apple Inc.",
-                        "eps_estimate": "1.43",
-                        "eps_actual": "1.52",
-                        "time": "AMC",
-                        "date": date_.strftime("%Y-%m-%d"),
-                    }
-                ]
-            }
-        }
+        return _mock_earnings_payload(date_)
 
     @log_api_call(logger)
     async def get_earnings_calendar(self, date_: date) -> Dict[str, Any]:
@@ -86,6 +95,25 @@ class NASDAQClient(BaseAPIClient):
             logger.warning(f"Could not fetch info for {symbol}: {str(e)}")
             return None
 
+    async def get_company_info_many(
+        self, symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch company information for several symbols concurrently."""
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(symbol: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_company_info(symbol)
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in unique_symbols), return_exceptions=True
+        )
+        return {
+            symbol: None if isinstance(result, BaseException) else result
+            for symbol, result in zip(unique_symbols, results, strict=True)
+        }
+
     @log_api_call(logger)
     async def get_historical_earnings(
         self, symbol: str, limit: int = 4
@@ -104,8 +132,30 @@ class NASDAQClient(BaseAPIClient):
         if self.is_test:
             return True
 
+        cached = self._symbol_validity.get(symbol)
+        if cached is not None:
+            return cached
+
         try:
             info = await self.get_company_info(symbol)
-            return info is not None and info.get("status") == "Active"
         except Exception:
             return False
+
+        # get_company_info returns None on failures, which are not remembered
+        if info is None:
+            return False
+        valid = info.get("status") == "Active"
+        self._symbol_validity[symbol] = valid
+        return valid
+
+    async def validate_symbols(self, symbols: List[str]) -> Dict[str, bool]:
+        """Validate several symbols concurrently."""
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+        async def check(symbol: str) -> bool:
+            async with semaphore:
+                return await self.validate_symbol(symbol)
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(check(symbol) for symbol in unique_symbols))
+        return dict(zip(unique_symbols, results, strict=True))
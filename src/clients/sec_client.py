@@ -2,19 +2,38 @@
 SEC API client implementation.
 """
 
-from typing import Any, Dict
+import gzip
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+import ijson
+import orjson
+from aiohttp import ClientResponse
 
 from config.settings import get_settings
-from src.clients.base_client import BaseAPIClient
+from src.clients.base_client import BaseAPIClient, ValidatorKey
+from src.models.base import is_valid_cik, normalize_symbol
+from src.utils.exceptions import APIError
 from src.utils.logging_utils import log_api_call, setup_logger
 
 settings = get_settings()
 logger = setup_logger(__name__)
 
+# How long a fetched company tickers file is reused
+TICKERS_TTL_SECONDS = 24 * 60 * 60
+
+TICKERS_ENDPOINT = "files/company_tickers.json"
+
 
 class SECClient(BaseAPIClient):
     """Client for interacting with SEC APIs."""
 
+    # Only the tickers file is revalidated; companyfacts bodies are not kept
+    CONDITIONAL_ENDPOINTS = frozenset({TICKERS_ENDPOINT})
+
     def __init__(self) -> None:
         """Initialize SEC API client with required headers."""
         super().__init__(
@@ -23,23 +42,137 @@ class SECClient(BaseAPIClient):
                 "User-Agent": f"ResearchProject {settings.SEC_USER_AGENT_EMAIL}",
                 "Accept": "application/json",
                 "Accept-Encoding": "gzip, deflate",
-                "Host": "www.sec.gov",
             },
             rate_limit_seconds=settings.SEC_RATE_LIMIT_SECONDS,
         )
+        self._tickers_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._cik_by_ticker: Dict[str, str] = {}
+        self._ticker_by_cik: Dict[str, str] = {}
+        self._cik_validity: Dict[str, bool] = {}
 
     @log_api_call(logger)
     async def get_company_tickers(self) -> Dict[str, Any]:
         """
         Fetch company tickers and CIK numbers from SEC.
 
+        The result is reused for TICKERS_TTL_SECONDS. A gzipped copy is kept
+        on disk with its ETag, so a new process only downloads the file again
+        when SEC reports that it changed.
+
         Returns:
             Dict[str, Any]: Mapping of company data including CIK numbers and tickers
 
         Raises:
             APIError: If the request fails
         """
-        return await self.get("files/company_tickers.json")
+        now = time.monotonic()
+        if self._tickers_cache and now - self._tickers_cache[0] < TICKERS_TTL_SECONDS:
+            return self._tickers_cache[1]
+
+        key = self._validator_key(TICKERS_ENDPOINT)
+        if key not in self._validator_cache:
+            self._load_tickers_file(key)
+        stored = self._validator_cache.get(key)
+
+        tickers = await self.get(TICKERS_ENDPOINT)
+
+        # A 304 leaves the stored entry in place; a fresh body replaces it
+        fetched = self._validator_cache.get(key)
+        if fetched is not None and fetched is not stored:
+            self._save_tickers_file(fetched)
+
+        self._tickers_cache = (now, tickers)
+        self._index_tickers(tickers)
+        return tickers
+
+    def cik_for_ticker(self, ticker: str) -> Optional[str]:
+        """
+        Look up a CIK in the most recently fetched tickers file.
+
+        Args:
+            ticker: Stock symbol
+
+        Returns:
+            Optional[str]: 10-digit CIK if known
+        """
+        return self._cik_by_ticker.get(normalize_symbol(ticker))
+
+    def ticker_for_cik(self, cik: str) -> Optional[str]:
+        """
+        Look up a ticker in the most recently fetched tickers file.
+
+        Args:
+            cik: 10-digit CIK
+
+        Returns:
+            Optional[str]: Normalized ticker if known
+        """
+        return self._ticker_by_cik.get(cik)
+
+    def _index_tickers(self, tickers: Dict[str, Any]) -> None:
+        """Build ticker <-> CIK lookup maps from a tickers file."""
+        cik_by_ticker: Dict[str, str] = {}
+        ticker_by_cik: Dict[str, str] = {}
+        for entry in tickers.values():
+            ticker = entry.get("ticker")
+            cik_str = entry.get("cik_str")
+            if not ticker or cik_str is None:
+                continue
+            symbol = normalize_symbol(ticker)
+            cik = str(cik_str).zfill(10)
+            cik_by_ticker[symbol] = cik
+            ticker_by_cik.setdefault(cik, symbol)
+        self._cik_by_ticker = cik_by_ticker
+        self._ticker_by_cik = ticker_by_cik
+
+    @staticmethod
+    def _tickers_file() -> Path:
+        """Location of the on-disk tickers copy."""
+        return settings.RAW_DATA_DIR / "sec" / "company_tickers.json.gz"
+
+    def _load_tickers_file(self, key: ValidatorKey) -> None:
+        """Seed the conditional-GET cache from the on-disk tickers copy."""
+        try:
+            with gzip.open(self._tickers_file(), "rb") as handle:
+                stored = orjson.loads(handle.read())
+            self._validator_cache[key] = (
+                stored.get("etag"),
+                stored.get("last_modified"),
+                stored["tickers"],
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tickers cache: {str(e)}")
+
+    def _save_tickers_file(
+        self, entry: Tuple[Optional[str], Optional[str], Dict[str, Any]]
+    ) -> None:
+        """Persist a tickers response and its validators, gzipped.
+
+        The file is written to a sibling temp file and swapped in with
+        ``os.replace``, so concurrent writers or readers never see a
+        half-written cache.
+        """
+        etag, last_modified, tickers = entry
+        path = self._tickers_file()
+        payload = orjson.dumps(
+            {"etag": etag, "last_modified": last_modified, "tickers": tickers}
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+            )
+            try:
+                with handle, gzip.GzipFile(fileobj=handle, mode="wb") as gz:
+                    gz.write(payload)
+                os.replace(handle.name, path)
+            except BaseException:
+                Path(handle.name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write tickers cache: {str(e)}")
 
     @log_api_call(logger)
     async def get_company_facts(self, cik: str) -> Dict[str, Any]:
@@ -56,11 +189,52 @@ class SECClient(BaseAPIClient):
             APIError: If the request fails
             ValueError: If CIK format is invalid
         """
-        if not (len(cik) == 10 and cik.isdigit()):
+        if not is_valid_cik(cik):
             raise ValueError("CIK must be 10 digits")
 
         return await self.get(f"api/xbrl/companyfacts/CIK{cik}.json")
 
+    @log_api_call(logger)
+    async def stream_company_facts(
+        self, cik: str, concepts: Set[str]
+    ) -> Dict[str, Any]:
+        """
+        Fetch selected us-gaap concepts for a CIK without parsing the whole body.
+
+        The response is decoded incrementally and reading stops once every
+        requested concept has been seen. Retries, the circuit breaker and
+        concurrency control apply as for get_company_facts, which should be
+        used when all facts are needed.
+
+        Args:
+            cik: Company CIK number (10 digits, zero-padded)
+            concepts: us-gaap concept names to keep, e.g. {"EarningsPerShareBasic"}
+
+        Returns:
+            Dict[str, Any]: Requested concepts that were present, by name
+
+        Raises:
+            APIError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            ValueError: If CIK format is invalid
+        """
+        if not is_valid_cik(cik):
+            raise ValueError("CIK must be 10 digits")
+
+        async def read_facts(response: ClientResponse) -> Dict[str, Any]:
+            facts: Dict[str, Any] = {}
+            async for concept, value in ijson.kvitems_async(
+                response.content, "facts.us-gaap", use_float=True
+            ):
+                if concept in concepts:
+                    facts[concept] = value
+                    if len(facts) == len(concepts):
+                        break
+            return facts
+
+        url = f"{self._url_prefix}api/xbrl/companyfacts/CIK{cik}.json"
+        return await self._with_retries(lambda: self._request("GET", url, read_facts))
+
     async def validate_cik(self, cik: str) -> bool:
         """
         Validate if a CIK exists and is active.
@@ -71,12 +245,23 @@ class SECClient(BaseAPIClient):
         Returns:
             bool: True if CIK is valid and active
         """
+        cached = self._cik_validity.get(cik)
+        if cached is not None:
+            return cached
+
         try:
             await self.get_company_facts(cik)
-            return True
+        except APIError as e:
+            # Only a definite "not found" is remembered; other failures may pass
+            if e.status_code == 404:
+                self._cik_validity[cik] = False
+            return False
         except Exception:
             return False
 
+        self._cik_validity[cik] = True
+        return True
+
     def format_cik(self, cik: str) -> str:
         """
         Format CIK to 10-digit format required by SEC.
@@ -90,6 +275,8 @@ class SECClient(BaseAPIClient):
         Raises:
             ValueError: If CIK cannot be formatted correctly
         """
+        if isinstance(cik, str) and is_valid_cik(cik):
+            return cik
         try:
             return str(int(cik)).zfill(10)
         except (ValueError, TypeError) as e:
@@ -2,11 +2,67 @@
 Base models with common functionality for all domain models.
 """
 
-from datetime import datetime
-from typing import Optional
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Iterator, Optional
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
+# Ten-digit, zero-padded SEC Central Index Key
+CIK_PATTERN = re.compile(r"\A[0-9]{10}\Z")
+
+# Share class separator normalization, e.g. BRK-B -> BRK.B
+_SYMBOL_TRANSLATION = str.maketrans("-", ".")
+
+
+def is_valid_cik(value: str) -> bool:
+    """Check that a CIK is exactly ten ASCII digits."""
+    return CIK_PATTERN.match(value) is not None
+
+
+def normalize_symbol(value: str) -> str:
+    """Normalize a ticker symbol to upper case with '.' class separators."""
+    return value.translate(_SYMBOL_TRANSLATION).upper()
+
+
+# Creation time shared by every model built inside ingest_timestamp()
+_ingest_now: ContextVar[Optional[datetime]] = ContextVar("ingest_now", default=None)
+
+
+def _current_timestamp() -> datetime:
+    """Return the shared ingest timestamp, or the current UTC time."""
+    return _ingest_now.get() or datetime.now(timezone.utc)
+
+
+@contextmanager
+def ingest_timestamp(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Stamp every model created in this context with the same created_at.
+
+    Args:
+        now: Timestamp to use, defaults to the current UTC time
+
+    Yields:
+        datetime: The shared timestamp
+    """
+    stamp = now or datetime.now(timezone.utc)
+    token = _ingest_now.set(stamp)
+    try:
+        yield stamp
+    finally:
+        _ingest_now.reset(token)
+
+
+def _orjson_default(value: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
 
 class BaseModelWithTimestamp(BaseModel):
     """Base model with timestamp tracking."""
@@ -15,15 +71,27 @@ class BaseModelWithTimestamp(BaseModel):
         frozen=True,  # Immutable objects
         validate_assignment=True,  # Validate on attribute assignment
         arbitrary_types_allowed=True,  # Allow custom types
-        json_encoders={datetime: lambda v: v.isoformat()},  # Custom JSON encoders
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_current_timestamp)
     updated_at: Optional[datetime] = None
 
+    def to_orjson(self) -> bytes:
+        """
+        Serialize the model to JSON bytes with orjson.
+
+        Returns:
+            bytes: JSON document
+        """
+        return orjson.dumps(
+            self.model_dump(),
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
+
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
-        object.__setattr__(self, "updated_at", datetime.utcnow())
+        object.__setattr__(self, "updated_at", datetime.now(timezone.utc))
 
 
 class AuditableModel(BaseModelWithTimestamp):
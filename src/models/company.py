@@ -3,11 +3,11 @@ Company-related domain models.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import Field, field_validator
 
-from src.models.base import AuditableModel
+from src.models.base import AuditableModel, is_valid_cik, normalize_symbol
 
 
 class Exchange(str, Enum):
@@ -38,7 +38,6 @@ class Company(AuditableModel):
         description="SEC Central Index Key",
         min_length=10,
         max_length=10,
-        pattern="^[0-9]{10}$",
     )
 
     symbol: str = Field(
@@ -83,7 +82,25 @@ class Company(AuditableModel):
         Returns:
             str: Normalized symbol
         """
-        return v.upper().replace("-", ".")
+        return normalize_symbol(v)
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "Company":
+        """
+        Build a company from already-validated data without running validators.
+
+        Only the symbol is normalized. Use the regular constructor for data
+        that comes straight from an external API.
+
+        Args:
+            data: Field values with their final types
+
+        Returns:
+            Company: Constructed company
+        """
+        values = dict(data)
+        values["symbol"] = cls.normalize_symbol(values["symbol"])
+        return cls.model_construct(**values)
 
     @field_validator("cik")
     @classmethod
@@ -100,7 +117,7 @@ class Company(AuditableModel):
         Raises:
             ValueError: If CIK format is invalid
         """
-        if not v.isdigit() or len(v) != 10:
+        if not is_valid_cik(v):
             raise ValueError("CIK must be 10 digits")
         return v
 
@@ -2,14 +2,17 @@
 Earnings-related domain models.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, time
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 from pydantic import ConfigDict, Field, field_validator
 
-from src.models.base import AuditableModel
+from src.models.base import AuditableModel, is_valid_cik, normalize_symbol
 
 
 class MarketSession(str, Enum):
@@ -38,7 +41,6 @@ class EarningsReport(AuditableModel):
     model_config = ConfigDict(
         frozen=True,
         arbitrary_types_allowed=True,
-        json_encoders={Decimal: str, time: lambda t: t.strftime("%H:%M:%S")},
         json_schema_extra={
             "example": {
                 "company_cik": "0000320193",
@@ -60,7 +62,6 @@ class EarningsReport(AuditableModel):
         description="Company CIK",
         min_length=10,
         max_length=10,
-        pattern="^[0-9]{10}$",
     )
 
     symbol: str = Field(..., description="Stock symbol", min_length=1, max_length=10)
@@ -114,7 +115,43 @@ class EarningsReport(AuditableModel):
     @classmethod
     def normalize_symbol(cls, v: str) -> str:
         """Normalize stock symbol format."""
-        return v.upper().replace("-", ".")
+        return normalize_symbol(v)
+
+    @field_validator("company_cik")
+    @classmethod
+    def validate_company_cik(cls, v: str) -> str:
+        """Validate CIK format."""
+        if not is_valid_cik(v):
+            raise ValueError("CIK must be 10 digits")
+        return v
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "EarningsReport":
+        """
+        Build a report from already-validated data without running validators.
+
+        Only the symbol is normalized and the surprises are filled in. Use
+        the regular constructor for data that comes straight from an
+        external API.
+
+        Args:
+            data: Field values with their final types
+
+        Returns:
+            EarningsReport: Constructed report
+        """
+        values = dict(data)
+        values["symbol"] = cls.normalize_symbol(values["symbol"])
+        # Fill surprises up front so the frozen model never needs patching
+        eps_estimate = values.get("eps_estimate")
+        eps_actual = values.get("eps_actual")
+        if eps_estimate is not None and eps_actual is not None:
+            values.setdefault("eps_surprise", eps_actual - eps_estimate)
+        revenue_estimate = values.get("revenue_estimate")
+        revenue_actual = values.get("revenue_actual")
+        if revenue_estimate is not None and revenue_actual is not None:
+            values.setdefault("revenue_surprise", revenue_actual - revenue_estimate)
+        return cls.model_construct(**values)
 
     def calculate_surprises(self) -> None:
         """Calculate EPS and revenue surprises if estimates and actuals exist."""
@@ -177,17 +214,32 @@ class EarningsSummary(AuditableModel):
 
         symbol = reports[0].symbol
         total_reports = len(reports)
-        beat_estimates = sum(
-            1 for r in reports if r.eps_surprise is not None and r.eps_surprise > 0
-        )
-        missed_estimates = sum(
-            1 for r in reports if r.eps_surprise is not None and r.eps_surprise < 0
-        )
 
-        surprises = [r.eps_surprise for r in reports if r.eps_surprise is not None]
-        average_surprise = sum(surprises) / len(surprises) if surprises else None
+        # Tally beats, misses and the surprise total in one pass; float is
+        # plenty for an average reported to six decimal places
+        beat_estimates = 0
+        missed_estimates = 0
+        surprise_total = 0.0
+        surprise_count = 0
+        for report in reports:
+            if report.eps_surprise is None:
+                continue
+            surprise = float(report.eps_surprise)
+            surprise_total += surprise
+            surprise_count += 1
+            if surprise > 0:
+                beat_estimates += 1
+            elif surprise < 0:
+                missed_estimates += 1
+
+        average_surprise = (
+            Decimal(f"{surprise_total / surprise_count:.6f}")
+            if surprise_count
+            else None
+        )
 
-        return cls(
+        # Every value is computed from validated reports
+        return cls.model_construct(
             symbol=symbol,
             period_start=start_date,
             period_end=end_date,
@@ -196,3 +248,132 @@ class EarningsSummary(AuditableModel):
             missed_estimates=missed_estimates,
             average_surprise=average_surprise,
         )
+
+    @classmethod
+    def from_surprise_array(
+        cls,
+        symbol: str,
+        surprises: np.ndarray,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> "EarningsSummary":
+        """
+        Create summary from an array of EPS surprises, one per report.
+
+        Args:
+            symbol: Stock symbol
+            surprises: Float EPS surprises, NaN where a report has none
+            start_date: Start date for summary period
+            end_date: End date for summary period
+
+        Returns:
+            EarningsSummary: Aggregated summary
+
+        Raises:
+            ValueError: If the array is empty
+        """
+        if surprises.size == 0:
+            raise ValueError("Cannot create summary from empty reports list")
+
+        known = surprises[~np.isnan(surprises)]
+        average_surprise = Decimal(f"{float(known.mean()):.6f}") if known.size else None
+
+        return cls.model_construct(
+            symbol=symbol,
+            period_start=start_date,
+            period_end=end_date,
+            total_reports=int(surprises.size),
+            beat_estimates=int(np.count_nonzero(known > 0)),
+            missed_estimates=int(np.count_nonzero(known < 0)),
+            average_surprise=average_surprise,
+        )
+
+
+@dataclass(frozen=True)
+class EarningsBatch:
+    """
+    Column-oriented batch of raw earnings calendar rows.
+
+    Holds one NumPy array per field so aggregate statistics run vectorized
+    instead of walking a list of EarningsReport models.
+    """
+
+    symbols: np.ndarray
+    report_dates: np.ndarray
+    eps_estimate: np.ndarray
+    eps_actual: np.ndarray
+    revenue_estimate: np.ndarray
+    revenue_actual: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "EarningsBatch":
+        """
+        Build a batch from NASDAQ earnings calendar rows.
+
+        Args:
+            rows: Calendar rows with symbol, date and estimate/actual fields
+
+        Returns:
+            EarningsBatch: Batch with unparseable numbers and dates as NaN/NaT
+        """
+        df = pd.DataFrame.from_records(
+            rows,
+            columns=[
+                "symbol",
+                "date",
+                "eps_estimate",
+                "eps_actual",
+                "revenue_estimate",
+                "revenue_actual",
+            ],
+        )
+
+        def numeric(column: str) -> np.ndarray:
+            return pd.to_numeric(df[column], errors="coerce").to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+
+        return cls(
+            symbols=df["symbol"]
+            .astype(str)
+            .map(normalize_symbol)
+            .to_numpy(dtype=object),
+            report_dates=pd.to_datetime(df["date"], errors="coerce").to_numpy(
+                dtype="datetime64[s]"
+            ),
+            eps_estimate=numeric("eps_estimate"),
+            eps_actual=numeric("eps_actual"),
+            revenue_estimate=numeric("revenue_estimate"),
+            revenue_actual=numeric("revenue_actual"),
+        )
+
+    def __len__(self) -> int:
+        """Number of rows in the batch."""
+        return len(self.symbols)
+
+    @property
+    def eps_surprise(self) -> np.ndarray:
+        """EPS surprise per row, NaN where either side is missing."""
+        return self.eps_actual - self.eps_estimate
+
+    def summarize(
+        self, symbol: str, start_date: datetime, end_date: datetime
+    ) -> EarningsSummary:
+        """
+        Summarize the rows for one symbol.
+
+        Args:
+            symbol: Stock symbol to summarize
+            start_date: Start date for summary period
+            end_date: End date for summary period
+
+        Returns:
+            EarningsSummary: Aggregated summary
+
+        Raises:
+            ValueError: If the batch has no rows for the symbol
+        """
+        mask = self.symbols == symbol
+        return EarningsSummary.from_surprise_array(
+            symbol, self.eps_surprise[mask], start_date, end_date
+        )
@@ -3,12 +3,34 @@ CSV-based repository implementation with thread-safe file handling.
 """
 
 import asyncio
+import csv
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
-import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
@@ -20,241 +42,591 @@ settings = get_settings()
 
 T = TypeVar("T", bound=BaseModel)
 
-
-def clean_nan_values(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert NaN values to None."""
-    cleaned: Dict[str, Any] = {}
-    for key, value in data.items():
-        cleaned[key] = None if pd.isna(value) else value
-    return cleaned
+# Rows per chunk when streaming a CSV
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Files at least this large are memory-mapped for full scans
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+# Key lookup strategies: "scan" reads rows until the key matches, "offset"
+# keeps a {key: byte offset} index and seeks straight to the row
+INDEX_MODES = ("scan", "offset")
+
+
+def _field_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Pick the CSV conversion for a model field from its annotation."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        return lambda value: value.model_dump_json()
+    if issubclass(annotation, Enum):
+        return lambda value: value.value
+    if issubclass(annotation, datetime):
+        return lambda value: value.isoformat()
+    return None
+
+
+@contextmanager
+def _csv_rows(path: Path) -> Iterator[Iterator[List[str]]]:
+    """Open a CSV for a sequential row scan, memory-mapping large files."""
+    if path.stat().st_size < MMAP_THRESHOLD_BYTES:
+        with path.open(newline="") as handle:
+            yield csv.reader(handle)
+        return
+
+    with (
+        path.open("rb") as raw,
+        mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        yield csv.reader(line.decode() for line in iter(mapped.readline, b""))
+
+
+@contextmanager
+def _open_bytes(path: Path) -> Iterator[Union[BinaryIO, mmap.mmap]]:
+    """Open a file for byte reads, memory-mapping it when it is large."""
+    with path.open("rb") as raw:
+        if os.fstat(raw.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            yield raw
+            return
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+
+def _scan_offsets(path: Path, key_position: int, start: int) -> Dict[str, int]:
+    """Map each key to the byte offset of its first row at or after ``start``.
+
+    ``start`` must be the beginning of a row, or 0 to skip the header.
+    """
+    offsets: Dict[str, int] = {}
+    line_starts: List[int] = []
+    with _open_bytes(path) as source:
+        source.seek(start)
+
+        def lines() -> Iterator[str]:
+            position = start
+            for line in iter(source.readline, b""):
+                line_starts.append(position)
+                position += len(line)
+                yield line.decode()
+
+        reader = csv.reader(lines())
+        if start == 0:
+            next(reader, None)
+        consumed = reader.line_num
+        for row in reader:
+            # A quoted field may span lines; the row starts where it began
+            row_start = line_starts[consumed]
+            consumed = reader.line_num
+            if len(row) > key_position and row[key_position]:
+                offsets.setdefault(row[key_position].zfill(10), row_start)
+    return offsets
+
+
+def _pad_key(value: Any) -> str:
+    """Format a key field value as a zero-padded string."""
+    return str(value).zfill(10)
+
+
+def _parse_datetimes(values: pd.Series) -> pd.Series:
+    """Parse a column of timestamps, falling back per value on mixed offsets."""
+    try:
+        return pd.to_datetime(values, errors="coerce", format="ISO8601")
+    except (TypeError, ValueError):
+        return values.map(
+            lambda v: None if pd.isna(v) or v == "" else pd.to_datetime(v)
+        )
 
 
 class CSVRepository(Repository[T], Generic[T]):
     """Base CSV repository implementation."""
 
-    def __init__(self, file_path: Path, model_class: Type[T], key_field: str) -> None:
-        """Initialize CSV repository."""
+    def __init__(
+        self,
+        file_path: Path,
+        model_class: Type[T],
+        key_field: str,
+        index_mode: str = "scan",
+    ) -> None:
+        """
+        Initialize CSV repository.
+
+        Args:
+            file_path: CSV file backing the repository
+            model_class: Model stored in each row
+            key_field: Field identifying a row
+            index_mode: "scan" to look keys up by reading rows, or "offset"
+                to keep an index of row byte offsets for unique keys
+
+        Raises:
+            ValueError: If index_mode is not one of INDEX_MODES
+        """
+        if index_mode not in INDEX_MODES:
+            raise ValueError(f"index_mode must be one of {INDEX_MODES}")
         super().__init__()
         self.file_path = file_path
         self.model_class = model_class
         self.key_field = key_field
         self._lock = asyncio.Lock()
+        # Parsed file contents and the (mtime_ns, size) they were read at;
+        # a changed stamp means another writer touched the file
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_stamp: Optional[Tuple[int, int]] = None
+        # Known keys for duplicate checks on append, survives own writes
+        self._keys: Optional[Set[str]] = None
+        self._keys_stamp: Optional[Tuple[int, int]] = None
+        # Byte offset of each key's row, built on first lookup in offset mode
+        self.index_mode = index_mode
+        self._offsets: Optional[Dict[str, int]] = None
+        self._offsets_stamp: Optional[Tuple[int, int]] = None
+        self._columns: List[str] = list(model_class.model_fields.keys())
+        # (field name, converter) pairs worked out once per model class
+        self._field_converters: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+            (
+                name,
+                (
+                    _pad_key
+                    if name == key_field
+                    else _field_converter(field_info.annotation)
+                ),
+            )
+            for name, field_info in model_class.model_fields.items()
+        ]
+        self._datetime_fields: Tuple[str, ...] = tuple(
+            name
+            for name, field_info in model_class.model_fields.items()
+            if field_info.annotation is datetime
+        )
         self._ensure_file_exists()
+        # Tell the C parser the schema so it never guesses dtypes
+        parse_dates = [name for name in self._datetime_fields if name in self._columns]
+        self._read_kwargs: Dict[str, Any] = {
+            "dtype": {name: str for name in self._columns if name not in parse_dates},
+            "parse_dates": parse_dates,
+            "date_format": "ISO8601",
+            "keep_default_na": False,
+            "na_values": [""],
+            "engine": "c",
+        }
 
     def _ensure_file_exists(self) -> None:
-        """Create CSV file if it doesn't exist."""
-        if not self.file_path.exists():
+        """Create CSV file if it doesn't exist and record its column order."""
+        try:
+            # Exclusive create: no separate existence check needed
+            with self.file_path.open("x", newline="") as handle:
+                csv.writer(handle).writerow(self._columns)
+        except FileExistsError:
+            with self.file_path.open("r+", newline="") as handle:
+                header = next(csv.reader(handle), None)
+                if header:
+                    # Appended rows must follow the header already on disk
+                    self._columns = header
+                else:
+                    csv.writer(handle).writerow(self._columns)
+        except FileNotFoundError:
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            fields = list(self.model_class.model_fields.keys())
-            df = pd.DataFrame(columns=fields)
-            df.to_csv(self.file_path, index=False)
+            self._ensure_file_exists()
 
     async def _read_df(self) -> pd.DataFrame:
         """Read CSV into DataFrame with proper error handling."""
         try:
             async with self._lock:
-                # Read with string type for key field and handle NaN values
-                df = pd.read_csv(
-                    self.file_path,
-                    dtype={self.key_field: str},
-                    keep_default_na=False,
-                    na_values=[""],
-                )
-                if df.empty:
-                    return pd.DataFrame(
-                        columns=list(self.model_class.model_fields.keys())
-                    )
-                # Ensure key field is properly formatted
-                if self.key_field in df.columns:
-                    df[self.key_field] = df[self.key_field].astype(str).str.zfill(10)
-                return df
+                stamp = self._file_stamp()
+                if self._df_cache is None or self._df_stamp != stamp:
+                    self._df_cache = self._load_df()
+                    self._df_stamp = stamp
+                # Callers may modify the frame they get back
+                return self._df_cache.copy()
         except Exception as e:
             raise StorageError(f"Failed to read CSV: {str(e)}") from e
 
-    async def _write_df(self, df: pd.DataFrame) -> None:
-        """Write DataFrame to CSV with proper error handling."""
+    def _load_df(self) -> pd.DataFrame:
+        """Parse the CSV file from disk."""
+        df = pd.read_csv(
+            self.file_path,
+            memory_map=self.file_path.stat().st_size >= MMAP_THRESHOLD_BYTES,
+            **self._read_kwargs,
+        )
+        if df.empty:
+            return pd.DataFrame(columns=list(self.model_class.model_fields.keys()))
+        # Swap NaN for None once so callers never check values one by one
+        df = df.astype(object).where(df.notna(), None)
+        # Ensure key field is properly formatted
+        if self.key_field in df.columns:
+            keys = df[self.key_field]
+            df[self.key_field] = keys.where(keys.isna(), keys.str.zfill(10))
+        return df
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) identifying the current file contents."""
+        stat = self.file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _cached_keys(self) -> Optional[Set[str]]:
+        """Return the key set if it still matches the file on disk.
+
+        Callers must hold ``self._lock``.
+        """
+        if self._keys is not None and self._keys_stamp == self._file_stamp():
+            return self._keys
+        return None
+
+    def _get_keys(self) -> Set[str]:
+        """Return the set of stored keys, scanning the file once if needed.
+
+        Callers must hold ``self._lock``.
+        """
+        keys = self._cached_keys()
+        if keys is None:
+            stamp = self._file_stamp()
+            df = self._df_cache
+            if (
+                df is not None
+                and self._df_stamp == stamp
+                and self.key_field in df.columns
+            ):
+                keys = set(df[self.key_field])
+            else:
+                keys = self._scan_keys()
+            self._keys = keys
+            self._keys_stamp = stamp
+        return keys
+
+    def _scan_keys(self) -> Set[str]:
+        """Read only the key column from disk."""
+        keys: Set[str] = set()
+        with _csv_rows(self.file_path) as reader:
+            header = next(reader, None)
+            if not header or self.key_field not in header:
+                return keys
+            position = header.index(self.key_field)
+            for row in reader:
+                if len(row) > position and row[position]:
+                    keys.add(row[position].zfill(10))
+        return keys
+
+    def _get_offsets(self) -> Dict[str, int]:
+        """Return the key -> row offset index, rebuilding it if stale.
+
+        Callers must hold ``self._lock``.
+        """
+        stamp = self._file_stamp()
+        if self._offsets is None or self._offsets_stamp != stamp:
+            self._offsets = _scan_offsets(
+                self.file_path, self._columns.index(self.key_field), 0
+            )
+            self._offsets_stamp = stamp
+        return self._offsets
+
+    def _read_row_at(self, offset: int) -> Dict[str, str]:
+        """Read the row starting at byte ``offset``."""
+        with self.file_path.open("rb") as raw:
+            raw.seek(offset)
+            reader = csv.reader(line.decode() for line in iter(raw.readline, b""))
+            return dict(zip(self._columns, next(reader), strict=False))
+
+    async def _append_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Append rows built by ``_model_to_dict``, rejecting duplicate keys.
+
+        Raises:
+            StorageError: If any key already exists or the write fails.
+        """
+        async with self._lock:
+            keys = self._get_keys()
+            new_keys = [row[self.key_field] for row in rows]
+            if len(rows) == 1 and new_keys[0] in keys:
+                raise StorageError(
+                    f"Entity with {self.key_field}={new_keys[0]} already exists"
+                )
+            if keys.intersection(new_keys):
+                raise StorageError("One or more entities already exist")
+            # Extend a current offset index with just the appended tail
+            tail_start: Optional[int] = None
+            if self._offsets is not None:
+                stamp = self._file_stamp()
+                if self._offsets_stamp == stamp:
+                    tail_start = stamp[1]
+            try:
+                with self.file_path.open("a", newline="") as handle:
+                    csv.writer(handle).writerows(
+                        [row.get(column, "") for column in self._columns]
+                        for row in rows
+                    )
+            except Exception as e:
+                # A partial write leaves the key set unreliable
+                self._keys = None
+                self._offsets = None
+                raise StorageError(f"Failed to write CSV: {str(e)}") from e
+            finally:
+                self._df_cache = None
+            keys.update(new_keys)
+            self._keys_stamp = self._file_stamp()
+            if tail_start is not None and self._offsets is not None:
+                position = self._columns.index(self.key_field)
+                for key, offset in _scan_offsets(
+                    self.file_path, position, tail_start
+                ).items():
+                    self._offsets.setdefault(key, offset)
+                self._offsets_stamp = self._keys_stamp
+
+    async def _read_rows(self) -> List[Dict[str, Optional[str]]]:
+        """Read every CSV row as a dict of raw strings."""
         try:
             async with self._lock:
-                # Convert None to empty string to avoid NaN
-                df = df.replace({np.nan: None})
-                df.to_csv(self.file_path, index=False, na_rep="")
+                with self.file_path.open(newline="") as handle:
+                    return list(csv.DictReader(handle))
         except Exception as e:
-            raise StorageError(f"Failed to write CSV: {str(e)}") from e
+            raise StorageError(f"Failed to read CSV: {str(e)}") from e
+
+    def _row_to_model(self, row: Dict[Optional[str], Optional[str]]) -> T:
+        """Build a model from raw CSV strings, letting pydantic parse them."""
+        data: Dict[str, Any] = {
+            name: value or None for name, value in row.items() if name is not None
+        }
+        key = data.get(self.key_field)
+        if key:
+            data[self.key_field] = key.zfill(10)
+        return self.model_class(**data)
+
+    def _write_rows(self, rows: Iterable[List[Any]]) -> None:
+        """Write the header and rows to a sibling temp file, then swap it in.
+
+        Callers must hold ``self._lock``. Readers never see a half-written
+        file because the swap is a single ``os.replace``.
+        """
+        self._df_cache = None
+        self._offsets = None
+        handle = tempfile.NamedTemporaryFile(
+            "w",
+            newline="",
+            dir=self.file_path.parent,
+            prefix=f".{self.file_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        try:
+            with handle:
+                writer = csv.writer(handle)
+                writer.writerow(self._columns)
+                writer.writerows(rows)
+            os.replace(handle.name, self.file_path)
+            self._keys_stamp = self._file_stamp()
+        except BaseException:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+
+    def _stream_rows(
+        self, key: str, new_data: Optional[Dict[str, Any]]
+    ) -> Iterator[List[str]]:
+        """Yield stored rows, updating or dropping those matching ``key``."""
+        with _csv_rows(self.file_path) as reader:
+            next(reader, None)
+            position = self._columns.index(self.key_field)
+            for row in reader:
+                if len(row) <= position or row[position].zfill(10) != key:
+                    yield row
+                elif new_data is not None:
+                    yield [
+                        new_data.get(column, old)
+                        for column, old in zip(self._columns, row, strict=False)
+                    ]
 
     def _model_to_dict(self, entity: T) -> Dict[str, Any]:
-        """Convert model to dictionary, handling nested models and enums."""
-        data = entity.model_dump()
-        # Convert any nested Pydantic models or enums to their string representation
-        for key, value in data.items():
-            if isinstance(value, BaseModel):
-                data[key] = value.model_dump_json()
-            elif isinstance(value, Enum):
-                data[key] = value.value
-            elif isinstance(value, datetime):
-                data[key] = value.isoformat() if value is not None else None
-            elif key == self.key_field and value is not None:
-                data[key] = str(value).zfill(10)
-            elif value is None:
-                data[key] = ""  # Use empty string for None values
+        """Convert model to a CSV row dict, with empty strings for None."""
+        values = entity.__dict__
+        data: Dict[str, Any] = {}
+        for name, convert in self._field_converters:
+            value = values[name]
+            if value is None:
+                data[name] = ""
+            elif convert is None:
+                data[name] = value
+            else:
+                data[name] = convert(value)
         return data
 
     async def add(self, entity: T) -> T:
         """Add new entity to CSV."""
-        df = await self._read_df()
-
-        key_value = str(getattr(entity, self.key_field)).zfill(10)
-        # Check for existing entity
-        if self.key_field in df.columns and not df.empty:
-            if df[df[self.key_field] == key_value].shape[0] > 0:
-                raise StorageError(
-                    f"Entity with {self.key_field}={key_value} already exists"
-                )
-
-        # Convert entity to dictionary and add as new row
-        new_data = self._model_to_dict(entity)
-        new_df = pd.DataFrame([new_data])
-
-        # Ensure column order matches
-        if not df.empty:
-            new_df = new_df[df.columns]
-
-        df = pd.concat([df, new_df], ignore_index=True)
-        await self._write_df(df)
+        await self._append_rows([self._model_to_dict(entity)])
         return entity
 
+    def _scan_for_key(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the first stored row with ``key``, stopping at the match."""
+        with _csv_rows(self.file_path) as reader:
+            header = next(reader, None)
+            if not header or self.key_field not in header:
+                return None
+            position = header.index(self.key_field)
+            for row in reader:
+                if len(row) > position and row[position].zfill(10) == key:
+                    return dict(zip(header, row, strict=False))
+        return None
+
     async def get(self, id_: Any) -> Optional[T]:
         """Get entity by ID."""
-        df = await self._read_df()
-
-        if df.empty:
-            return None
-
-        # Ensure ID is properly formatted for comparison
         id_formatted = str(id_).zfill(10)
+        try:
+            async with self._lock:
+                if self.index_mode == "offset":
+                    offset = self._get_offsets().get(id_formatted)
+                    row = None if offset is None else self._read_row_at(offset)
+                else:
+                    keys = self._cached_keys()
+                    if keys is not None and id_formatted not in keys:
+                        return None
+                    row = self._scan_for_key(id_formatted)
+        except Exception as e:
+            raise StorageError(f"Failed to read CSV: {str(e)}") from e
 
-        # Find matching row
-        row = df[df[self.key_field] == id_formatted]
-        if row.empty:
+        if row is None:
             return None
-
         try:
-            # Convert row to dict and clean NaN values
-            data = clean_nan_values(row.iloc[0].to_dict())
-
-            # Convert types as needed
-            for field_name, field_info in self.model_class.model_fields.items():
-                if field_info.annotation == datetime and isinstance(
-                    data.get(field_name), str
-                ):
-                    data[field_name] = (
-                        pd.to_datetime(data[field_name]) if data[field_name] else None
-                    )
-                elif field_name == self.key_field and data.get(field_name):
-                    data[field_name] = str(data[field_name]).zfill(10)
-
-            return self.model_class(**data)
+            return self._row_to_model(row)
         except Exception as e:
             raise StorageError(f"Failed to convert data to model: {str(e)}") from e
 
-    async def get_all(self) -> List[T]:
-        """Get all entities."""
+    def _df_to_models(self, df: pd.DataFrame) -> List[T]:
+        """Convert DataFrame rows to models, converting whole columns at once.
+
+        Datetime columns are passed through as parsed by ``read_csv`` (or as
+        ISO strings when streamed); pydantic accepts both.
+        """
+        columns = df.columns.tolist()
+        frame = df.astype(object)
+        if self.key_field in columns:
+            keys = frame[self.key_field]
+            frame[self.key_field] = keys.where(
+                keys.isna() | (keys == ""), keys.astype(str).str.zfill(10)
+            )
+        frame = frame.where(frame.notna(), None)
+
+        model_class = self.model_class
+        return [
+            model_class(**dict(zip(columns, values, strict=True)))
+            for values in zip(*(frame[c].to_numpy() for c in columns), strict=True)
+        ]
+
+    def _filter_equal(self, df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
+        """Keep rows whose columns equal the given values, before building models."""
+        for column, value in filters.items():
+            if column == self.key_field:
+                value = str(value).zfill(10)
+            df = df.loc[df[column] == value]
+        return df
+
+    async def _query(self, filters: Dict[str, Any]) -> List[T]:
+        """Get entities whose columns equal the given values."""
         df = await self._read_df()
-        if df.empty:
-            return []
+        try:
+            return self._df_to_models(self._filter_equal(df, filters))
+        except Exception as e:
+            raise StorageError(f"Failed to process query: {str(e)}") from e
 
+    async def get_all(self) -> List[T]:
+        """Get all entities."""
+        rows = await self._read_rows()
         try:
-            entities = []
-            for _, row in df.iterrows():
-                data = clean_nan_values(row.to_dict())
-                for field_name, field_info in self.model_class.model_fields.items():
-                    if field_info.annotation == datetime and isinstance(
-                        data.get(field_name), str
-                    ):
-                        data[field_name] = (
-                            pd.to_datetime(data[field_name])
-                            if data[field_name]
-                            else None
-                        )
-                    elif field_name == self.key_field and data.get(field_name):
-                        data[field_name] = str(data[field_name]).zfill(10)
-                entities.append(self.model_class(**data))
-            return entities
+            return [self._row_to_model(row) for row in rows]
         except Exception as e:
             raise StorageError(f"Failed to convert data to models: {str(e)}") from e
 
+    async def iter_frames(
+        self, chunksize: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Stream the raw CSV in chunks, keeping every column as a string."""
+        try:
+            reader = pd.read_csv(
+                self.file_path,
+                dtype=str,
+                keep_default_na=False,
+                na_values=[""],
+                chunksize=chunksize,
+            )
+        except Exception as e:
+            raise StorageError(f"Failed to read CSV: {str(e)}") from e
+
+        with reader:
+            for chunk in reader:
+                yield chunk
+
+    async def iter_all(self, chunksize: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[T]:
+        """Stream all entities without materializing the full list."""
+        async for chunk in self.iter_frames(chunksize):
+            try:
+                entities = self._df_to_models(chunk)
+            except Exception as e:
+                raise StorageError(f"Failed to convert data to models: {str(e)}") from e
+            for entity in entities:
+                yield entity
+
     async def add_many(self, entities: List[T]) -> List[T]:
         """Add multiple entities to CSV."""
         if not entities:
             return []
 
-        df = await self._read_df()
-
-        # Convert entities to DataFrames for efficient comparison
-        new_dicts = [self._model_to_dict(entity) for entity in entities]
-        new_df = pd.DataFrame(new_dicts)
-
-        # Check for duplicates
-        if self.key_field in df.columns and not df.empty:
-            key_values = set(df[self.key_field].values)
-            new_keys = set(new_df[self.key_field].values)
-            if key_values.intersection(new_keys):
-                raise StorageError("One or more entities already exist")
-
-        # Ensure column order matches
-        if not df.empty:
-            new_df = new_df[df.columns]
+        await self._append_rows([self._model_to_dict(entity) for entity in entities])
+        return entities
 
-        # Concatenate and save
-        df = pd.concat([df, new_df], ignore_index=True)
-        await self._write_df(df)
+    async def replace_all(self, entities: List[T]) -> List[T]:
+        """Replace the entire CSV contents with the given entities."""
+        rows = (self._model_to_dict(entity) for entity in entities)
+        try:
+            async with self._lock:
+                self._keys = None
+                self._write_rows(
+                    [row.get(column, "") for column in self._columns] for row in rows
+                )
+        except Exception as e:
+            raise StorageError(f"Failed to write CSV: {str(e)}") from e
         return entities
 
     async def update(self, entity: T) -> Optional[T]:
         """Update existing entity."""
-        df = await self._read_df()
-
-        if df.empty:
-            return None
-
-        key_value = str(getattr(entity, self.key_field)).zfill(10)
-        mask = df[self.key_field] == key_value
-        if not df[mask].shape[0]:
-            return None
-
-        # Update row with new data
         new_data = self._model_to_dict(entity)
-        for column in df.columns:
-            if column in new_data:
-                df.loc[mask, column] = new_data[column]
-
-        await self._write_df(df)
+        key_value = new_data[self.key_field]
+        try:
+            async with self._lock:
+                if key_value not in self._get_keys():
+                    return None
+                self._write_rows(self._stream_rows(key_value, new_data))
+        except Exception as e:
+            raise StorageError(f"Failed to write CSV: {str(e)}") from e
         return entity
 
     async def delete(self, id_: Any) -> bool:
         """Delete entity by ID."""
-        df = await self._read_df()
-
-        if df.empty:
-            return False
-
         id_formatted = str(id_).zfill(10)
-        mask = df[self.key_field] == id_formatted
-        if not df[mask].shape[0]:
-            return False
-
-        df = df[~mask]
-        await self._write_df(df)
+        try:
+            async with self._lock:
+                keys = self._get_keys()
+                if id_formatted not in keys:
+                    return False
+                self._write_rows(self._stream_rows(id_formatted, None))
+                keys.discard(id_formatted)
+        except Exception as e:
+            raise StorageError(f"Failed to write CSV: {str(e)}") from e
         return True
 
     async def exists(self, id_: Any) -> bool:
         """Check if entity exists."""
-        df = await self._read_df()
-        if df.empty:
-            return False
-
         id_formatted = str(id_).zfill(10)
-        matches = df[df[self.key_field] == id_formatted].shape[0]
-        return matches > 0
+        try:
+            async with self._lock:
+                if self.index_mode == "offset":
+                    return id_formatted in self._get_offsets()
+                keys = self._cached_keys()
+                if keys is not None:
+                    return id_formatted in keys
+                return self._scan_for_key(id_formatted) is not None
+        except Exception as e:
+            raise StorageError(f"Failed to read CSV: {str(e)}") from e
 
 
 class TimeRangeCSVRepository(CSVRepository[T], TimeRangeRepository[T], Generic[T]):
@@ -267,6 +639,17 @@ class TimeRangeCSVRepository(CSVRepository[T], TimeRangeRepository[T], Generic[T
         super().__init__(file_path, model_class, key_field)
         self.date_field = date_field
 
+    def _filter_date_range(
+        self, df: pd.DataFrame, start_date: datetime, end_date: datetime
+    ) -> pd.DataFrame:
+        """Keep rows whose date falls within the range, inclusive."""
+        # Parse the date column once; unparseable dates fall outside any range
+        dates = _parse_datetimes(df[self.date_field])
+        mask = (dates >= start_date) & (dates <= end_date)
+        filtered_df = df.loc[mask]
+        filtered_df[self.date_field] = dates[mask]
+        return filtered_df
+
     async def get_by_date_range(
         self, start_date: datetime, end_date: datetime
     ) -> List[T]:
@@ -277,27 +660,23 @@ class TimeRangeCSVRepository(CSVRepository[T], TimeRangeRepository[T], Generic[T
             return []
 
         try:
-            # Convert date column to datetime
-            df[self.date_field] = pd.to_datetime(df[self.date_field])
-
-            # Filter by date range
-            mask = (df[self.date_field] >= start_date) & (
-                df[self.date_field] <= end_date
-            )
-            filtered_df = df[mask]
-
-            # Convert to models
-            entities = []
-            for _, row in filtered_df.iterrows():
-                data = row.to_dict()
-                for field_name, field_info in self.model_class.model_fields.items():
-                    if field_info.annotation == datetime and isinstance(
-                        data.get(field_name), str
-                    ):
-                        data[field_name] = pd.to_datetime(data[field_name])
-                    elif field_name == self.key_field and data.get(field_name):
-                        data[field_name] = str(data[field_name]).zfill(10)
-                entities.append(self.model_class(**data))
-            return entities
+            return self._df_to_models(self._filter_date_range(df, start_date, end_date))
         except Exception as e:
             raise StorageError(f"Failed to process date range query: {str(e)}") from e
+
+    async def _query(
+        self,
+        filters: Dict[str, Any],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[T]:
+        """Get entities matching column filters and an optional date range."""
+        df = await self._read_df()
+
+        try:
+            df = self._filter_equal(df, filters)
+            if start_date and end_date and not df.empty:
+                df = self._filter_date_range(df, start_date, end_date)
+            return self._df_to_models(df)
+        except Exception as e:
+            raise StorageError(f"Failed to process query: {str(e)}") from e
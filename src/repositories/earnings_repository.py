@@ -2,9 +2,9 @@
 Earnings data repository implementation.
 """
 
-from datetime import datetime
+from datetime import date as Date, datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional
 
 import pandas as pd
 
@@ -38,6 +38,25 @@ class EarningsRepository(TimeRangeCSVRepository[EarningsReport]):
 
         self.daily_dir = self.base_dir / "daily"
         self.daily_dir.mkdir(exist_ok=True)
+        self._daily_repos: Dict[Path, TimeRangeCSVRepository[EarningsReport]] = {}
+
+    def _daily_file(self, date: Date) -> Path:
+        """Get the daily earnings file path for a date."""
+        return self.daily_dir / f"{date.strftime('%Y-%m-%d')}_earnings.csv"
+
+    def _daily_repository(self, date: Date) -> TimeRangeCSVRepository[EarningsReport]:
+        """Get the repository for a daily file, reusing it across calls."""
+        daily_file = self._daily_file(date)
+        repo = self._daily_repos.get(daily_file)
+        if repo is None:
+            repo = TimeRangeCSVRepository(
+                file_path=daily_file,
+                model_class=EarningsReport,
+                key_field=self.key_field,
+                date_field=self.date_field,
+            )
+            self._daily_repos[daily_file] = repo
+        return repo
 
     async def add_daily_report(
         self, date: datetime, report: EarningsReport
@@ -55,20 +74,70 @@ class EarningsRepository(TimeRangeCSVRepository[EarningsReport]):
         Raises:
             StorageError: If operation fails
         """
-        daily_file = self.daily_dir / f"{date.strftime('%Y-%m-%d')}_earnings.csv"
-        daily_repo = TimeRangeCSVRepository(
-            file_path=daily_file,
-            model_class=EarningsReport,
-            key_field="symbol",
-            date_field="report_date",
-        )
+        await self.add_daily_reports(date, [report])
+        return report
+
+    async def add_daily_reports(
+        self, date: datetime, reports: List[EarningsReport]
+    ) -> List[EarningsReport]:
+        """
+        Add a day's earnings reports to the daily and master files at once.
+
+        Args:
+            date: Report date
+            reports: Earnings reports for the date
+
+        Returns:
+            List[EarningsReport]: Added reports
+
+        Raises:
+            StorageError: If operation fails
+        """
+        if not reports:
+            return []
 
+        # Serialize once and append the same rows to both files
+        rows = [self._model_to_dict(report) for report in reports]
         try:
-            await daily_repo.add(report)
-            await self.add(report)
-            return report
+            await self._daily_repository(date)._append_rows(rows)
+            await self._append_rows(rows)
+            return reports
         except Exception as e:
-            raise StorageError(f"Failed to add daily report: {str(e)}") from e
+            raise StorageError(f"Failed to add daily reports: {str(e)}") from e
+
+    async def write_daily_batch(
+        self, date: Date, df: pd.DataFrame, append: bool = False
+    ) -> Path:
+        """
+        Write a batch of serialized reports as the daily file for a date.
+
+        Any existing daily file for the date is replaced unless appending.
+
+        Args:
+            date: Report date
+            df: Reports serialized with model_dump(mode="json") or raw CSV rows
+            append: Append to the existing daily file instead of replacing it
+
+        Returns:
+            Path: Daily file that was written
+
+        Raises:
+            StorageError: If operation fails
+        """
+        daily_file = self._daily_file(date)
+        try:
+            df = df.reindex(columns=list(self.model_class.model_fields.keys()))
+            df[self.key_field] = df[self.key_field].astype(str).str.zfill(10)
+            df.to_csv(
+                daily_file,
+                mode="a" if append else "w",
+                header=not append,
+                index=False,
+                na_rep="",
+            )
+            return daily_file
+        except Exception as e:
+            raise StorageError(f"Failed to write daily batch: {str(e)}") from e
 
     async def get_by_symbol(
         self,
@@ -87,12 +156,7 @@ class EarningsRepository(TimeRangeCSVRepository[EarningsReport]):
         Returns:
             List[EarningsReport]: Matching reports
         """
-        if start_date and end_date:
-            all_reports = await self.get_by_date_range(start_date, end_date)
-        else:
-            all_reports = await self.get_all()
-
-        return [r for r in all_reports if r.symbol == symbol]
+        return await self._query({"symbol": symbol}, start_date, end_date)
 
     async def get_summary(
         self, symbol: str, start_date: datetime, end_date: datetime
@@ -140,18 +204,12 @@ class EarningsRepository(TimeRangeCSVRepository[EarningsReport]):
         Returns:
             List[datetime]: Dates with no reports
         """
-        # Create set of dates as datetime objects
-        all_dates: Set[datetime] = {
-            datetime.combine(
-                (start_date + pd.Timedelta(days=x)).date(), datetime.min.time()
-            )
-            for x in range((end_date - start_date).days + 1)
-        }
+        all_dates = pd.date_range(start_date.date(), end_date.date(), freq="D")
 
         reports = await self.get_by_date_range(start_date, end_date)
-        # Ensure consistent datetime format for comparison
-        report_dates = {
-            datetime.combine(r.report_date.date(), datetime.min.time()) for r in reports
-        }
+        # Calendar day of each report in its own timezone, as in date()
+        report_dates = pd.DatetimeIndex(
+            [r.report_date.replace(tzinfo=None) for r in reports]
+        ).normalize()
 
-        return sorted(all_dates - report_dates)
+        return list(all_dates.difference(report_dates).to_pydatetime())
@@ -3,11 +3,12 @@ Service for managing CIK (Central Index Key) data.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set
 
 from config.settings import get_settings
 from src.clients.sec_client import SECClient
+from src.models.base import normalize_symbol
 from src.models.company import Company, CompanyStatus
 from src.repositories.csv_repository import CSVRepository
 from src.utils.exceptions import APIError, StorageError
@@ -37,21 +38,24 @@ class CIKService:
         self._last_refresh: Optional[datetime] = None
 
     async def _refresh_cache(self) -> None:
-        """Refresh the internal CIK cache."""
+        """Load the company list into the cache if it has been invalidated.
+
+        The cache is only reloaded after ``update_company_list`` changes the
+        stored companies. While an update holds the lock, lookups wait for it
+        instead of reading the stale cache.
+        """
+        if self._last_refresh is not None and not self._cache_lock.locked():
+            return
+
         async with self._cache_lock:
-            # Check if cache is still fresh
-            now = datetime.utcnow()
-            if self._last_refresh and now - self._last_refresh < timedelta(hours=24):
+            if self._last_refresh is not None:
                 return
 
-            # Clear existing cache
-            self._cache.clear()
-
-            # Get all companies
             companies = await self.repository.get_all()
-            self._cache = {company.symbol: company for company in companies}
-
-            self._last_refresh = now
+            self._cache = {
+                normalize_symbol(company.symbol): company for company in companies
+            }
+            self._last_refresh = datetime.now(timezone.utc)
 
     @log_execution_time(logger)
     async def get_company(self, symbol: str) -> Optional[Company]:
@@ -65,8 +69,7 @@ class CIKService:
             Optional[Company]: Company if found
         """
         await self._refresh_cache()
-        normalized_symbol = symbol.upper().replace("-", ".")
-        return self._cache.get(normalized_symbol)
+        return self._cache.get(normalize_symbol(symbol))
 
     @log_execution_time(logger)
     async def get_cik(self, symbol: str) -> Optional[str]:
@@ -82,6 +85,26 @@ class CIKService:
         company = await self.get_company(symbol)
         return company.cik if company else None
 
+    async def get_ciks_bulk(self, symbols: List[str]) -> Dict[str, str]:
+        """
+        Resolve CIKs for many symbols with a single cache check.
+
+        Args:
+            symbols: Stock symbols
+
+        Returns:
+            Dict[str, str]: Mapping of each known symbol to its CIK; unknown
+            symbols are omitted
+        """
+        await self._refresh_cache()
+        cache = self._cache
+        ciks: Dict[str, str] = {}
+        for symbol in symbols:
+            company = cache.get(normalize_symbol(symbol))
+            if company is not None:
+                ciks[symbol] = company.cik
+        return ciks
+
     @log_execution_time(logger)
     async def update_company_list(self) -> Set[str]:
         """
@@ -94,56 +117,58 @@ class CIKService:
             APIError: If SEC API request fails
             StorageError: If storage operation fails
         """
-        try:
-            # Get current companies
-            current_companies = await self.repository.get_all()
-            current_symbols = {c.symbol for c in current_companies}
-
-            # Get new data from SEC
-            company_data = await self.sec_client.get_company_tickers()
-
-            # Process new companies
-            new_companies = []
-            new_symbols = set()
-
-            for data in company_data.values():
-                symbol = data.get("ticker") or data.get("symbol")
-                if not symbol:
-                    logger.warning(f"Missing symbol for {data.get('title')}")
-                    continue
-
-                symbol = symbol.upper().replace("-", ".")
-                if symbol in current_symbols:
-                    continue
-
-                try:
-                    company = Company(
-                        cik=str(data["cik_str"]).zfill(10),
-                        symbol=symbol,
-                        name=data["title"],
-                        status=CompanyStatus.ACTIVE,
-                    )
-                    new_companies.append(company)
-                    new_symbols.add(symbol)
-                except ValueError as e:
-                    logger.error(f"Invalid company data for {symbol}: {str(e)}")
-
-            # Save new companies
-            if new_companies:
-                await self.repository.add_many(new_companies)
-                logger.info(f"Added {len(new_companies)} new companies")
-
-                # Force cache refresh
-                self._last_refresh = None
-
-            return new_symbols
-
-        except APIError:
-            logger.error("Failed to fetch company data from SEC", exc_info=True)
-            raise
-        except StorageError:
-            logger.error("Failed to store company data", exc_info=True)
-            raise
+        # Hold the cache lock so concurrent lookups wait for the new list
+        async with self._cache_lock:
+            try:
+                # Get current companies
+                current_companies = await self.repository.get_all()
+                current_symbols = {c.symbol for c in current_companies}
+
+                # Get new data from SEC
+                company_data = await self.sec_client.get_company_tickers()
+
+                # Process new companies
+                new_companies = []
+                new_symbols = set()
+
+                for data in company_data.values():
+                    symbol = data.get("ticker") or data.get("symbol")
+                    if not symbol:
+                        logger.warning(f"Missing symbol for {data.get('title')}")
+                        continue
+
+                    symbol = normalize_symbol(symbol)
+                    if symbol in current_symbols:
+                        continue
+
+                    try:
+                        company = Company(
+                            cik=str(data["cik_str"]).zfill(10),
+                            symbol=symbol,
+                            name=data["title"],
+                            status=CompanyStatus.ACTIVE,
+                        )
+                        new_companies.append(company)
+                        new_symbols.add(symbol)
+                    except ValueError as e:
+                        logger.error(f"Invalid company data for {symbol}: {str(e)}")
+
+                # Save new companies
+                if new_companies:
+                    await self.repository.add_many(new_companies)
+                    logger.info(f"Added {len(new_companies)} new companies")
+
+                    # Force cache refresh
+                    self._last_refresh = None
+
+                return new_symbols
+
+            except APIError:
+                logger.error("Failed to fetch company data from SEC", exc_info=True)
+                raise
+            except StorageError:
+                logger.error("Failed to store company data", exc_info=True)
+                raise
 
     @log_execution_time(logger)
     async def validate_symbols(self, symbols: List[str]) -> Dict[str, bool]:
@@ -157,10 +182,8 @@ class CIKService:
             Dict[str, bool]: Mapping of symbols to validity
         """
         await self._refresh_cache()
-        return {
-            symbol: symbol.upper().replace("-", ".") in self._cache
-            for symbol in symbols
-        }
+        cache = self._cache
+        return {symbol: normalize_symbol(symbol) in cache for symbol in symbols}
 
     async def get_active_companies(self) -> List[Company]:
         """
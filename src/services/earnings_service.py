@@ -3,12 +3,17 @@ Service for managing earnings data collection and analysis.
 """
 
 import asyncio
-from datetime import datetime
-from decimal import Decimal
-from typing import Any, Dict, List, Optional, cast
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
 
 from config.settings import get_settings
 from src.clients.nasdaq_client import NASDAQClient
+from src.models.base import ingest_timestamp, normalize_symbol
 from src.models.earnings import (
     EarningsReport,
     EarningsStatus,
@@ -24,6 +29,163 @@ from src.utils.logging_utils import log_execution_time, setup_logger
 settings = get_settings()
 logger = setup_logger(__name__)
 
+# Most summaries kept in memory at once
+SUMMARY_CACHE_SIZE = 1024
+
+# (symbol, start, end) -> (expires at, summary)
+SummaryKey = Tuple[str, datetime, datetime]
+CachedSummary = Tuple[float, Optional[EarningsSummary]]
+
+
+# Longest symbol EarningsReport accepts
+MAX_SYMBOL_LENGTH = 10
+
+# Stands in for a numeric field that could not be parsed
+_INVALID = object()
+
+_NUMERIC_FIELDS = ("eps_estimate", "eps_actual", "revenue_estimate", "revenue_actual")
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    """Parse an optional numeric field, treating empty values as missing."""
+    if not value:
+        return None
+    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+
+
+def _to_decimal_or_invalid(value: Any) -> Any:
+    """Parse one numeric field, returning _INVALID instead of raising.
+
+    NaN and infinities count as invalid, as EarningsReport would reject them.
+    """
+    try:
+        number = _to_decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        return _INVALID
+    if number is not None and not number.is_finite():
+        return _INVALID
+    return number
+
+
+def _parse_time(value: str) -> Optional[time]:
+    """Parse an ``HH:MM`` report time, returning None for anything else."""
+    hour, separator, minute = value.partition(":")
+    if not separator:
+        return None
+    try:
+        return time(int(hour), int(minute))
+    except ValueError:
+        return None
+
+
+_SESSION_MAP: Dict[str, MarketSession] = {
+    "": MarketSession.UNSPECIFIED,
+    "amc": MarketSession.AFTER_MARKET,
+    "bmo": MarketSession.PRE_MARKET,
+    "time-after-hours": MarketSession.AFTER_MARKET,
+    "time-pre-market": MarketSession.PRE_MARKET,
+    "time-not-supplied": MarketSession.UNSPECIFIED,
+    "after-market": MarketSession.AFTER_MARKET,
+    "after-market close": MarketSession.AFTER_MARKET,
+    "after market close": MarketSession.AFTER_MARKET,
+    "before-market open": MarketSession.PRE_MARKET,
+    "before market open": MarketSession.PRE_MARKET,
+    "pre-market": MarketSession.PRE_MARKET,
+}
+
+
+def _market_session(value: str) -> MarketSession:
+    """
+    Map a lowercased NASDAQ time code to a market session.
+
+    Args:
+        value: Lowercased, stripped time string
+
+    Returns:
+        MarketSession: Known codes by lookup, otherwise by keyword
+    """
+    session = _SESSION_MAP.get(value)
+    if session is not None:
+        return session
+    if "before" in value:
+        return MarketSession.PRE_MARKET
+    if "after" in value:
+        return MarketSession.AFTER_MARKET
+    return MarketSession.UNSPECIFIED
+
+
+def _parse_earnings_rows(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Parse NASDAQ calendar rows column by column.
+
+    Args:
+        rows: Raw calendar rows
+
+    Returns:
+        pd.DataFrame: One row per input row with typed report fields; rows
+        without a valid symbol or with an unparseable or non-finite number
+        are dropped and logged, and unparseable dates are None
+    """
+    df = pd.DataFrame.from_records(
+        rows,
+        columns=[
+            "symbol",
+            "date",
+            "time",
+            "eps_estimate",
+            "eps_actual",
+            "revenue_estimate",
+            "revenue_actual",
+        ],
+    )
+    df = df.astype(object).where(df.notna(), None)
+    has_symbol = df["symbol"].astype(bool)
+    if not has_symbol.all():
+        logger.warning(
+            "Missing symbol in %d earnings data rows", int((~has_symbol).sum())
+        )
+        df = df[has_symbol]
+
+    # Same bound as EarningsReport.symbol, which the trusted path skips
+    too_long = df["symbol"].astype(str).str.len() > MAX_SYMBOL_LENGTH
+    if too_long.any():
+        logger.warning(
+            "Skipping earnings rows with overlong symbols: %s",
+            ", ".join(map(str, df.loc[too_long, "symbol"])),
+        )
+        df = df[~too_long]
+
+    # Converted value by value so one bad field only costs its own row
+    numbers = {
+        field: df[field].map(_to_decimal_or_invalid) for field in _NUMERIC_FIELDS
+    }
+    invalid = pd.Series(False, index=df.index)
+    for values in numbers.values():
+        invalid |= values.map(lambda value: value is _INVALID).astype(bool)
+    if invalid.any():
+        logger.warning(
+            "Skipping earnings rows with unparseable or non-finite numbers for %s",
+            ", ".join(map(str, df.loc[invalid, "symbol"])),
+        )
+        df = df[~invalid]
+        numbers = {field: values[~invalid] for field, values in numbers.items()}
+
+    times = df["time"].fillna("").astype(str)
+    lowered = times.str.strip().str.lower()
+    sessions = {value: _market_session(value) for value in lowered.unique()}
+    session = lowered.map(sessions)
+
+    dates = pd.to_datetime(df["date"], format="ISO8601", errors="coerce")
+    return pd.DataFrame(
+        {
+            "symbol": df["symbol"],
+            "report_date": dates.astype(object).where(dates.notna(), None),
+            "report_time": times.map(_parse_time),
+            "market_session": session,
+            **numbers,
+        }
+    )
+
 
 class EarningsService:
     """Service for managing earnings data."""
@@ -46,7 +208,12 @@ class EarningsService:
         self.cik_service = cik_service
         self.repository = earnings_repository
         self.trading_calendar = TradingCalendar()
-        self._processing_lock = asyncio.Lock()
+        # Bounds concurrent NASDAQ calendar fetches across dates
+        self._fetch_semaphore = asyncio.Semaphore(settings.NASDAQ_CONCURRENCY)
+        # Serializes storage for the same date only; other dates proceed
+        self._date_locks: Dict[date, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Least recently used summaries first
+        self._summary_cache: OrderedDict[SummaryKey, CachedSummary] = OrderedDict()
 
     async def _process_earnings_data(
         self, raw_data: Dict[str, Any]
@@ -60,80 +227,61 @@ class EarningsService:
         Returns:
             List[EarningsReport]: Processed earnings reports
         """
-        reports = []
-        rows = raw_data.get("data", {}).get("rows", [])
-
-        for row in rows:
-            try:
-                # Get CIK for symbol
-                symbol = row.get("symbol")
-                if not symbol:
-                    logger.warning("Missing symbol in earnings data")
-                    continue
+        try:
+            rows = raw_data["data"]["rows"]
+        except (KeyError, TypeError):
+            # NASDAQ sends "data": null or omits rows on empty days
+            rows = None
+        if not rows:
+            return []
 
-                cik = await self.cik_service.get_cik(symbol)
-                if not cik:
-                    logger.warning(f"No CIK found for symbol {symbol}")
-                    continue
+        parsed = _parse_earnings_rows(rows)
+        return await self._enrich_reports(parsed)
 
-                # Parse report date and time
-                date_str = cast(str, row.get("date", ""))
-                report_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-                time_str = row.get("time", "")
-                if time_str:
-                    try:
-                        report_time = datetime.strptime(time_str, "%H:%M").time()
-                    except ValueError:
-                        report_time = None
-                else:
-                    report_time = None
-
-                # Determine market session
-                market_session = MarketSession.UNSPECIFIED
-                if time_str:
-                    if "before" in time_str.lower():
-                        market_session = MarketSession.PRE_MARKET
-                    elif "after" in time_str.lower():
-                        market_session = MarketSession.AFTER_MARKET
-
-                # Create report
-                report = EarningsReport(
-                    company_cik=cik,
-                    symbol=symbol,
-                    report_date=report_date,
-                    report_time=report_time,
-                    market_session=market_session,
-                    eps_estimate=(
-                        Decimal(str(row.get("eps_estimate", 0)))
-                        if row.get("eps_estimate")
-                        else None
-                    ),
-                    eps_actual=(
-                        Decimal(str(row.get("eps_actual", 0)))
-                        if row.get("eps_actual")
-                        else None
-                    ),
-                    revenue_estimate=(
-                        Decimal(str(row.get("revenue_estimate", 0)))
-                        if row.get("revenue_estimate")
-                        else None
-                    ),
-                    revenue_actual=(
-                        Decimal(str(row.get("revenue_actual", 0)))
-                        if row.get("revenue_actual")
-                        else None
-                    ),
-                    status=EarningsStatus.CONFIRMED,
-                )
-
-                # Calculate surprises
-                report.calculate_surprises()
-                reports.append(report)
-
-            except Exception as e:
-                logger.error(f"Error processing earnings row: {str(e)}", exc_info=True)
-                continue
+    async def _enrich_reports(self, parsed: pd.DataFrame) -> List[EarningsReport]:
+        """
+        Attach CIKs to already-parsed calendar rows and build reports.
+
+        Args:
+            parsed: Typed rows from _parse_earnings_rows
+
+        Returns:
+            List[EarningsReport]: Reports for rows with a known CIK and date
+        """
+        if parsed.empty:
+            return []
+
+        # Resolve each distinct symbol once, up front, so the row loop never awaits
+        cik_map = await self.cik_service.get_ciks_bulk(
+            parsed["symbol"].unique().tolist()
+        )
+
+        reports = []
+        columns = parsed.columns.tolist()
+        # One created_at for the whole calendar page
+        with ingest_timestamp():
+            for values in parsed.itertuples(index=False, name=None):
+                row = dict(zip(columns, values, strict=True))
+                try:
+                    symbol = row["symbol"]
+                    cik = cik_map.get(symbol)
+                    if not cik:
+                        logger.warning("No CIK found for symbol %s", symbol)
+                        continue
+                    if row["report_date"] is None:
+                        raise ValueError(f"Invalid report date for {symbol}")
+
+                    # Every field is parsed and typed above, so skip re-validation
+                    row["company_cik"] = cik
+                    row["report_date"] = row["report_date"].to_pydatetime()
+                    row["status"] = EarningsStatus.CONFIRMED
+                    report = EarningsReport.from_trusted_dict(row)
+
+                    reports.append(report)
+
+                except Exception as e:
+                    logger.error("Error processing earnings row: %s", e, exc_info=True)
+                    continue
 
         return reports
 
@@ -155,30 +303,50 @@ class EarningsService:
         # Convert datetime to date for trading calendar check
         check_date = date_obj.date()
         if not self.trading_calendar.is_trading_day(check_date):
-            logger.info(f"{check_date} is not a trading day")
+            logger.info("%s is not a trading day", check_date)
             return []
 
-        async with self._processing_lock:
-            try:
-                # Get earnings data using date object
+        return await self._fetch_daily_earnings_unchecked(date_obj)
+
+    async def _fetch_daily_earnings_unchecked(
+        self, date_obj: datetime
+    ) -> List[EarningsReport]:
+        """
+        Fetch and store earnings for a date already known to be a trading day.
+
+        Args:
+            date_obj: Trading day to fetch earnings for
+
+        Returns:
+            List[EarningsReport]: Processed earnings reports
+
+        Raises:
+            APIError: If NASDAQ API request fails
+            StorageError: If storage operation fails
+        """
+        check_date = date_obj.date()
+        try:
+            # Get earnings data using date object
+            async with self._fetch_semaphore:
                 raw_data = await self.nasdaq_client.get_earnings_calendar(check_date)
-                reports = await self._process_earnings_data(raw_data)
+            reports = await self._process_earnings_data(raw_data)
 
-                # Store reports
-                for report in reports:
-                    await self.repository.add_daily_report(date_obj, report)
+            # Store reports; each CSV file serializes its own appends
+            async with self._date_locks[check_date]:
+                await self.repository.add_daily_reports(date_obj, reports)
+            self._invalidate_summaries(report.symbol for report in reports)
 
-                logger.info(
-                    f"Processed {len(reports)} earnings reports for {check_date}"
-                )
-                return reports
+            logger.info(
+                "Processed %d earnings reports for %s", len(reports), check_date
+            )
+            return reports
 
-            except APIError as e:
-                logger.error(f"Failed to fetch earnings data: {str(e)}", exc_info=True)
-                raise
-            except StorageError as e:
-                logger.error(f"Failed to store earnings data: {str(e)}", exc_info=True)
-                raise
+        except APIError as e:
+            logger.error("Failed to fetch earnings data: %s", e, exc_info=True)
+            raise
+        except StorageError as e:
+            logger.error("Failed to store earnings data: %s", e, exc_info=True)
+            raise
 
     @log_execution_time(logger)
     async def update_earnings_data(
@@ -194,21 +362,33 @@ class EarningsService:
         Returns:
             Dict[datetime, int]: Number of reports processed per date
         """
-        results: Dict[datetime, int] = {}
+        dates: List[datetime] = []
         current_date = start_date
-
+        if not self.trading_calendar.is_trading_day(current_date.date()):
+            # Only the start needs checking; next_trading_day skips the rest
+            next_date = self.trading_calendar.next_trading_day(current_date.date())
+            current_date = datetime.combine(next_date, datetime.min.time())
         while current_date <= end_date:
-            try:
-                reports = await self.fetch_daily_earnings(current_date)
-                results[current_date] = len(reports)
-            except Exception as e:
-                logger.error(f"Failed to process {current_date.date()}: {str(e)}")
-                results[current_date] = 0
-
+            dates.append(current_date)
             # Get next trading day as datetime at start of day
             next_date = self.trading_calendar.next_trading_day(current_date.date())
             current_date = datetime.combine(next_date, datetime.min.time())
 
+        # Dates are independent; the fetch semaphore bounds the concurrency
+        outcomes = await asyncio.gather(
+            *(self._fetch_daily_earnings_unchecked(day) for day in dates),
+            return_exceptions=True,
+        )
+
+        results: Dict[datetime, int] = {}
+        for day, outcome in zip(dates, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to process %s: %s", day.date(), outcome)
+                results[day] = 0
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[day] = len(outcome)
         return results
 
     async def get_earnings_summary(
@@ -225,7 +405,29 @@ class EarningsService:
         Returns:
             Optional[EarningsSummary]: Summary if data exists
         """
-        return await self.repository.get_summary(symbol, start_date, end_date)
+        # Cache and query under the same stored form of the symbol
+        symbol = normalize_symbol(symbol)
+        key = (symbol, start_date, end_date)
+        now = monotonic()
+        cached = self._summary_cache.get(key)
+        if cached is not None and cached[0] > now:
+            self._summary_cache.move_to_end(key)
+            return cached[1]
+
+        summary = await self.repository.get_summary(symbol, start_date, end_date)
+        self._summary_cache[key] = (now + settings.SUMMARY_CACHE_TTL_SECONDS, summary)
+        self._summary_cache.move_to_end(key)
+        if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+        return summary
+
+    def _invalidate_summaries(self, symbols: Iterable[str]) -> None:
+        """Drop cached summaries for symbols that just got new reports."""
+        stale = {normalize_symbol(symbol) for symbol in symbols}
+        if not stale:
+            return
+        for key in [key for key in self._summary_cache if key[0] in stale]:
+            del self._summary_cache[key]
 
     async def get_missing_dates(
         self, start_date: datetime, end_date: datetime
@@ -241,8 +443,4 @@ class EarningsService:
             List[datetime]: Dates with missing data
         """
         all_missing = await self.repository.get_missing_dates(start_date, end_date)
-        return [
-            date
-            for date in all_missing
-            if self.trading_calendar.is_trading_day(date.date())
-        ]
+        return self.trading_calendar.filter_trading_days(all_missing)
@@ -3,13 +3,47 @@ Date handling utilities for the SEC Earnings Scraper.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Generator, Optional
+from functools import lru_cache
+from typing import FrozenSet, Generator, Iterable, List, Optional, TypeVar
 
 import pandas as pd
 from pandas.tseries.holiday import (
     USFederalHolidayCalendar,
 )
 
+# Span covered by the precomputed holiday set; other dates query the calendar
+HOLIDAY_CACHE_START = date(2000, 1, 1)
+HOLIDAY_CACHE_END = date(2050, 12, 31)
+
+
+@lru_cache(maxsize=1)
+def _cached_holidays() -> FrozenSet[date]:
+    """Build the federal holiday set once per process."""
+    holidays = USFederalHolidayCalendar().holidays(
+        HOLIDAY_CACHE_START, HOLIDAY_CACHE_END
+    )
+    return frozenset(holidays.date)
+
+
+@lru_cache(maxsize=1)
+def _cached_holiday_ordinals() -> FrozenSet[int]:
+    """Holiday set as proleptic ordinals for integer-only date loops."""
+    return frozenset(day.toordinal() for day in _cached_holidays())
+
+
+def _in_cached_span(first: date, last: date) -> bool:
+    """Check whether a date range lies inside the precomputed holiday span."""
+    return HOLIDAY_CACHE_START <= first and last <= HOLIDAY_CACHE_END
+
+
+@lru_cache(maxsize=1)
+def _cached_holiday_index() -> pd.DatetimeIndex:
+    """Holiday set as a sorted index for vectorized membership checks."""
+    return pd.DatetimeIndex(sorted(_cached_holidays()))
+
+
+D = TypeVar("D", bound=date)
+
 
 class TradingCalendar:
     """Handles trading calendar related operations."""
@@ -31,11 +65,39 @@ class TradingCalendar:
         if date_obj.weekday() >= 5:
             return False
 
-        # Check if it's a holiday - convert to datetime for holiday check
+        if isinstance(date_obj, datetime):
+            date_obj = date_obj.date()
+        if HOLIDAY_CACHE_START <= date_obj <= HOLIDAY_CACHE_END:
+            return date_obj not in _cached_holidays()
+
+        # Outside the cached span - convert to datetime for holiday check
         dt = datetime.combine(date_obj, datetime.min.time())
         holidays = self.calendar.holidays(dt, dt, return_name=False)
         return len(holidays) == 0
 
+    def filter_trading_days(self, dates: Iterable[D]) -> List[D]:
+        """
+        Keep only the trading days from a collection of dates.
+
+        Args:
+            dates: Dates or datetimes to filter, in any order
+
+        Returns:
+            List[D]: The given objects that fall on trading days, order kept
+        """
+        dates = list(dates)
+        if not dates:
+            return []
+
+        days = pd.DatetimeIndex(dates).normalize()
+        if days.min().date() < HOLIDAY_CACHE_START or (
+            days.max().date() > HOLIDAY_CACHE_END
+        ):
+            return [d for d in dates if self.is_trading_day(d)]
+
+        keep = (days.dayofweek < 5) & ~days.isin(_cached_holiday_index())
+        return [d for d, is_open in zip(dates, keep, strict=True) if is_open]
+
     def next_trading_day(self, date_obj: date) -> date:
         """
         Get the next trading day after the given date.
@@ -46,10 +108,21 @@ class TradingCalendar:
         Returns:
             date: Next trading day
         """
-        next_day = date_obj + timedelta(days=1)
-        while not self.is_trading_day(next_day):
-            next_day += timedelta(days=1)
-        return next_day
+        if isinstance(date_obj, datetime):
+            date_obj = date_obj.date()
+        # A trading day is at most a couple of weeks out
+        if not _in_cached_span(date_obj, date_obj + timedelta(days=14)):
+            next_day = date_obj + timedelta(days=1)
+            while not self.is_trading_day(next_day):
+                next_day += timedelta(days=1)
+            return next_day
+
+        holidays = _cached_holiday_ordinals()
+        ordinal = date_obj.toordinal() + 1
+        # date.weekday() == (ordinal + 6) % 7
+        while (ordinal + 6) % 7 >= 5 or ordinal in holidays:
+            ordinal += 1
+        return date.fromordinal(ordinal)
 
     def get_trading_days(
         self, start_date: date, end_date: date
@@ -64,23 +137,52 @@ class TradingCalendar:
         Yields:
             date: Each trading day in the range
         """
-        current_date = start_date
-        while current_date <= end_date:
-            if self.is_trading_day(current_date):
-                yield current_date
-            current_date += timedelta(days=1)
+        if isinstance(start_date, datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        if not _in_cached_span(start_date, end_date):
+            current_date = start_date
+            while current_date <= end_date:
+                if self.is_trading_day(current_date):
+                    yield current_date
+                current_date += timedelta(days=1)
+            return
+
+        holidays = _cached_holiday_ordinals()
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            if (ordinal + 6) % 7 < 5 and ordinal not in holidays:
+                yield date.fromordinal(ordinal)
+
+
+# Non-ISO formats tried before falling back to pandas' general parser
+_DATE_FORMATS = ("%m/%d/%Y", "%Y/%m/%d", "%b %d, %Y")
 
 
 def parse_date(date_str: str) -> Optional[date]:
     """
     Safely parse a date string into a date object.
 
+    ISO 8601 strings and a few common formats are parsed directly; anything
+    else goes through pandas.
+
     Args:
         date_str: Date string in various formats
 
     Returns:
         Optional[date]: Parsed date or None if parsing fails
     """
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except (ValueError, TypeError):
+        pass
+
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, date_format).date()
+        except (ValueError, TypeError):
+            continue
+
     try:
         return pd.to_datetime(date_str).date()
     except (ValueError, TypeError):
@@ -31,6 +31,21 @@ class APIError(ScraperBaseException):
 class RateLimitError(APIError):
     """Raised when rate limits are exceeded."""
 
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_body: Optional[str] = None,
+        original_error: Optional[Exception] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message, status_code, response_body, original_error)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(APIError):
+    """Raised without a request while a client's circuit breaker is open."""
+
     pass
 
 
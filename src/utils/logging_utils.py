@@ -2,21 +2,48 @@
 Logging configuration and utilities for the SEC Earnings Scraper.
 """
 
+import asyncio
 import logging
 import sys
+import time
 from datetime import datetime
-from functools import wraps
-from typing import Any, Callable
+from functools import lru_cache, wraps
+from typing import Any, Callable, Tuple
 
 from config.settings import get_settings
 
 settings = get_settings()
 
 
+@lru_cache(maxsize=1)
+def _shared_handlers() -> Tuple[logging.Handler, ...]:
+    """
+    Build the file and console handlers shared by all loggers.
+
+    Returns:
+        Tuple of configured handlers
+    """
+    log_file = settings.LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.log"
+    file_handler = logging.FileHandler(log_file)
+    console_handler = logging.StreamHandler(sys.stdout)
+
+    formatter = logging.Formatter(settings.LOG_FORMAT)
+
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+        handler.setLevel(settings.LOG_LEVEL)
+
+    return file_handler, console_handler
+
+
+@lru_cache(maxsize=None)
 def setup_logger(name: str) -> logging.Logger:
     """
     Set up a logger with file and console handlers.
 
+    Repeated calls for the same name return the cached logger, and all
+    loggers share one file handler and one console handler.
+
     Args:
         name: The name of the logger, typically __name__
 
@@ -24,27 +51,46 @@ def setup_logger(name: str) -> logging.Logger:
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
     logger.setLevel(settings.LOG_LEVEL)
+    for handler in _shared_handlers():
+        logger.addHandler(handler)
 
-    if not logger.handlers:
-        log_file = settings.LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.log"
-        file_handler = logging.FileHandler(log_file)
-        console_handler = logging.StreamHandler(sys.stdout)
+    return logger
 
-        formatter = logging.Formatter(settings.LOG_FORMAT)
 
-        for handler in (file_handler, console_handler):
-            handler.setFormatter(formatter)
-            handler.setLevel(settings.LOG_LEVEL)
-            logger.addHandler(handler)
+def _log_duration(logger: logging.Logger, func: Callable, start_time: float) -> None:
+    """Log how long a successful call took, at debug level."""
+    # Skip the clock read when debug output is off
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Function %s executed in %.2f seconds",
+            func.__name__,
+            time.perf_counter() - start_time,
+        )
 
-    return logger
+
+def _log_failure(
+    logger: logging.Logger, func: Callable, start_time: float, error: Exception
+) -> None:
+    """Log a failed call with the time spent before it failed."""
+    logger.error(
+        "Function %s failed after %.2f seconds: %s",
+        func.__name__,
+        time.perf_counter() - start_time,
+        error,
+    )
 
 
 def log_execution_time(logger: logging.Logger) -> Callable:
     """
     Decorator to log function execution time.
 
+    Coroutine functions get an async wrapper so the time covers the awaited
+    work, not just creating the coroutine.
+
     Args:
         logger: Logger instance to use for logging
 
@@ -53,26 +99,31 @@ def log_execution_time(logger: logging.Logger) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start_time = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    _log_failure(logger, func, start_time, e)
+                    raise
+                _log_duration(logger, func, start_time)
+                return result
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.debug(
-                    f"Function {func.__name__} executed in {duration:.2f} seconds"
-                )
-                return result
             except Exception as e:
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.error(
-                    "Function {} failed after {:.2f} seconds: {}".format(
-                        func.__name__, duration, str(e)
-                    )
-                )
+                _log_failure(logger, func, start_time, e)
                 raise
+            _log_duration(logger, func, start_time)
+            return result
 
         return wrapper
 
@@ -93,14 +144,14 @@ def log_api_call(logger: logging.Logger) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.info(f"API call to {func.__name__} started")
-            logger.debug(f"Parameters: args={args}, kwargs={kwargs}")
+            logger.info("API call to %s started", func.__name__)
+            logger.debug("Parameters: args=%r, kwargs=%r", args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                logger.info(f"API call to {func.__name__} completed successfully")
+                logger.info("API call to %s completed successfully", func.__name__)
                 return result
             except Exception as e:
-                logger.error(f"API call to {func.__name__} failed: {str(e)}")
+                logger.error("API call to %s failed: %s", func.__name__, e)
                 raise
 
         return wrapper
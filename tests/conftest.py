@@ -3,6 +3,7 @@
 import json
 import os
 import pytest
+import pytest_asyncio
 import aiohttp
 from datetime import datetime
 from pathlib import Path
@@ -38,100 +39,187 @@ def mock_settings(monkeypatch, tmp_path):
     reset_settings()
 
 
+_NASDAQ_PAYLOAD = {
+    "data": {
+        "rows": [
+            {
+                "symbol": "AAPL",
+                "name": "Apple Inc.",
+                "eps_estimate": "1.43",
+                "eps_actual": "1.52",
+                "time": "AMC",
+                "date": datetime.now().strftime("%Y-%m-%d"),
+            }
+        ]
+    }
+}
+
+_SEC_PAYLOAD = {
+    "0": {"cik_str": "0000320193", "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": "0001018724", "ticker": "AMZN", "title": "AMAZON.COM, INC."},
+}
+
+_DEFAULT_PAYLOAD = {"status": "success"}
+
+# URL fragment -> payload, checked in order; bodies are serialized once
+_URL_PAYLOADS = (
+    ("/files/company_tickers.json", _SEC_PAYLOAD),
+    ("nasdaq.com", _NASDAQ_PAYLOAD),
+)
+_PAYLOAD_TEXTS = {
+    id(payload): json.dumps(payload)
+    for payload in (_SEC_PAYLOAD, _NASDAQ_PAYLOAD, _DEFAULT_PAYLOAD)
+}
+
+
+def _payload_for(url):
+    """Return the canned payload for a mocked URL."""
+    for fragment, payload in _URL_PAYLOADS:
+        if fragment in url:
+            return payload
+    return _DEFAULT_PAYLOAD
+
+
+class MockResponse:
+    def __init__(self, url):
+        self.url = url
+        self.status = 200
+        self.headers = {}
+        self._payload = _payload_for(url)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def json(self):
+        return self._payload
+
+    async def text(self):
+        return _PAYLOAD_TEXTS[id(self._payload)]
+
+    async def read(self):
+        return (await self.text()).encode()
+
+    def release(self):
+        pass
+
+
+class ErrorResponse:
+    def __init__(self, url):
+        self.url = url
+
+    async def __aenter__(self):
+        raise aiohttp.ClientResponseError(
+            request_info=aiohttp.RequestInfo(
+                url=self.url, method="GET", headers={}, real_url=self.url
+            ),
+            history=(),
+            status=404,
+            message="Not Found",
+            headers={},
+        )
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class MockClientSession:
+    def __init__(self, *args, **kwargs):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def request(self, method, url, **kwargs):
+        if "invalid-endpoint" in url:
+            return ErrorResponse(url)
+        else:
+            return MockResponse(url)
+
+    async def close(self):
+        self.closed = True
+
+
 @pytest.fixture
 def mock_nasdaq_data():
     """Mock NASDAQ API response data."""
-    return {
-        "data": {
-            "rows": [
-                {
-                    "symbol": "AAPL",
-                    "name": "Apple Inc.",
-                    "eps_estimate": "1.43",
-                    "eps_actual": "1.52",
-                    "time": "AMC",
-                    "date": datetime.now().strftime("%Y-%m-%d"),
-                }
-            ]
-        }
-    }
+    return _NASDAQ_PAYLOAD
 
 
 @pytest.fixture
 def mock_sec_response():
     """Mock SEC API response data."""
-    return {
-        "0": {"cik_str": "0000320193", "ticker": "AAPL", "title": "Apple Inc."},
-        "1": {"cik_str": "0001018724", "ticker": "AMZN", "title": "AMAZON.COM, INC."},
-    }
+    return _SEC_PAYLOAD
 
 
-@pytest.fixture(autouse=True)
-def mock_apis(monkeypatch, mock_sec_response, mock_nasdaq_data):
-    """Mock API clients."""
-
-    class MockResponse:
-        def __init__(self, url):
-            self.url = url
-            self.status = 200
-            self.headers = {}
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
-
-        async def json(self):
-            if "/files/company_tickers.json" in self.url:
-                return mock_sec_response
-            elif "nasdaq.com" in self.url:
-                return mock_nasdaq_data
-            else:
-                return {"status": "success"}
-
-        async def text(self):
-            return json.dumps(await self.json())
-
-        def release(self):
-            pass
-
-    class ErrorResponse:
-        def __init__(self, url):
-            self.url = url
-
-        async def __aenter__(self):
-            raise aiohttp.ClientResponseError(
-                request_info=aiohttp.RequestInfo(
-                    url=self.url, method="GET", headers={}, real_url=self.url
-                ),
-                history=(),
-                status=404,
-                message="Not Found",
-                headers={},
-            )
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
-
-    class MockClientSession:
-        def __init__(self, *args, **kwargs):
-            self.closed = False
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, *args):
-            await self.close()
-
-        def request(self, method, url, **kwargs):
-            if "invalid-endpoint" in url:
-                return ErrorResponse(url)
-            else:
-                return MockResponse(url)
-
-        async def close(self):
-            self.closed = True
-
+@pytest.fixture
+def mock_apis(monkeypatch):
+    """Mock API clients; opt in with pytest.mark.usefixtures("mock_apis")."""
     monkeypatch.setattr("aiohttp.ClientSession", MockClientSession)
     monkeypatch.setattr("src.clients.base_client.ClientSession", MockClientSession)
+
+
+@pytest.fixture(scope="session")
+def session_mock_apis():
+    """Mock API clients for the whole session, for session-scoped clients."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("aiohttp.ClientSession", MockClientSession)
+        mp.setattr("src.clients.base_client.ClientSession", MockClientSession)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sec_client(session_mock_apis):
+    """
+    One SECClient shared by every test that only reads from it.
+
+    Tests using it must run on the session loop with
+    pytest.mark.asyncio(loop_scope="session"). The client memoizes tickers
+    and CIK validity, so tests that count fetches need a private client.
+    """
+    from src.clients.sec_client import SECClient
+
+    async with SECClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def apple_company():
+    """Apple test company, validated once and shared by every test."""
+    from src.models.company import Company, CompanyStatus, Exchange
+
+    return Company(
+        cik="0000320193",
+        symbol="AAPL",
+        name="Apple Inc.",
+        exchange=Exchange.NASDAQ,
+        status=CompanyStatus.ACTIVE,
+    )
+
+
+@pytest.fixture
+def company_repository(tmp_path):
+    """Empty company repository in the test's tmp_path."""
+    from src.models.company import Company
+    from src.repositories.csv_repository import CSVRepository
+
+    return CSVRepository(
+        file_path=tmp_path / "companies.csv", model_class=Company, key_field="cik"
+    )
+
+
+@pytest.fixture
+def cik_service(sec_client, company_repository):
+    """
+    CIK service over the shared SEC client.
+
+    Only the repository and the service's own lookup cache are per test.
+    """
+    from src.services.cik_service import CIKService
+
+    return CIKService(sec_client, company_repository)
@@ -57,6 +57,15 @@ def main():
         "ignore::pytest.PytestDeprecationWarning",
     ]
 
+    # Spread test modules across CPUs when installed (pip install .[dev]);
+    # loadscope keeps each module's shared fixtures on one worker
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        args.extend(["-n", "auto", "--dist=loadscope"])
+
     print("\nRunning tests with configuration:")
     print(f"Test Directory: {tests_dir}")
     print(f"Python Path: {sys.path[0:2]}\n")
@@ -1,7 +1,19 @@
 """Test base client context management."""
 
+import asyncio
+import json
+
 import pytest
-from src.clients.base_client import BaseAPIClient
+from src.clients.base_client import (
+    RATE_LIMIT_WINDOW_SECONDS,
+    VALIDATOR_CACHE_SIZE,
+    BaseAPIClient,
+    _parse_retry_after,
+    settings,
+)
+from src.utils.exceptions import CircuitOpenError
+
+pytestmark = pytest.mark.usefixtures("mock_apis")
 
 
 class MockClient(BaseAPIClient):
@@ -30,3 +42,157 @@ async def test_multiple_clients():
             assert client1._session is not None
             assert client2._session is not None
             assert client1._session is not client2._session
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_window_admits_burst():
+    """Test that a full window of requests starts without waiting."""
+    client = BaseAPIClient("https://test.com", rate_limit_seconds=0.1)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await asyncio.gather(*(client._wait_for_slot() for _ in range(10)))
+    assert loop.time() - start < RATE_LIMIT_WINDOW_SECONDS / 2
+
+    # The next request has to wait for the window to slide
+    await client._wait_for_slot()
+    assert loop.time() - start >= RATE_LIMIT_WINDOW_SECONDS * 0.9
+
+
+@pytest.mark.parametrize(
+    "rate_limit_seconds, expected_wait",
+    [(2.0, 2.0), (0.6, 0.6), (0.3, 0.9)],
+)
+@pytest.mark.asyncio
+async def test_rate_limit_never_exceeds_configured_rate(
+    monkeypatch, rate_limit_seconds, expected_wait
+):
+    """Test that the window never admits more than one request per interval."""
+    client = BaseAPIClient("https://test.com", rate_limit_seconds=rate_limit_seconds)
+    for _ in range(client._window_limit):
+        await client._wait_for_slot()
+
+    waits = []
+
+    async def record_sleep(delay):
+        waits.append(delay)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr("src.clients.base_client.asyncio.sleep", record_sleep)
+    with pytest.raises(asyncio.CancelledError):
+        await client._wait_for_slot()
+
+    # The next start waits out the whole window it filled
+    assert waits[0] == pytest.approx(expected_wait, abs=0.05)
+    rate = client._window_limit / client._window_seconds
+    assert rate <= 1 / rate_limit_seconds + 1e-9
+
+
+@pytest.mark.asyncio
+async def test_overload_halves_concurrency_and_trips_circuit(monkeypatch):
+    """Test that repeated overload shrinks concurrency and opens the circuit."""
+    client = MockClient()
+    starting = client._concurrency
+
+    client._record_failure(asyncio.TimeoutError())
+    assert client._concurrency == max(1.0, starting / 2)
+
+    for _ in range(settings.CIRCUIT_BREAKER_THRESHOLD):
+        client._record_failure(asyncio.TimeoutError())
+
+    # A tripped client fails fast instead of retrying through the cooldown
+    sleeps = []
+    monkeypatch.setattr("src.clients.base_client.asyncio.sleep", sleeps.append)
+    with pytest.raises(CircuitOpenError, match="Circuit open"):
+        await client._make_request("GET", "anything")
+    assert sleeps == []
+    await client.cleanup()
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, HTTP dates and bad values."""
+    assert _parse_retry_after("3") == 3.0
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body=None):
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def read(self):
+        return json.dumps(self._body).encode()
+
+
+class ConditionalClient(BaseAPIClient):
+    """Test client that revalidates its calendar endpoint."""
+
+    CONDITIONAL_ENDPOINTS = frozenset({"calendar"})
+
+    def __init__(self):
+        super().__init__("https://test.com")
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_serves_cached_body_on_304():
+    """Test that a 304 answer reuses the body cached with its ETag."""
+    client = ConditionalClient()
+    key = client._validator_key("calendar")
+
+    first = FakeResponse(200, {"ETag": '"v1"'}, {"value": 1})
+    assert await client._read_response(key, first, None) == {"value": 1}
+
+    kwargs = {}
+    cached = client._add_conditional_headers(key, kwargs)
+    assert kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    not_modified = FakeResponse(304, {})
+    assert await client._read_response(key, not_modified, cached) == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_keeps_validators_per_params():
+    """Test that requests differing only in params never share validators."""
+    client = ConditionalClient()
+    monday = client._validator_key("calendar", {"date": "2024-01-15"})
+    tuesday = client._validator_key("calendar", {"date": "2024-01-16"})
+
+    response = FakeResponse(200, {"ETag": '"mon"'}, {"rows": ["monday"]})
+    await client._read_response(monday, response, None)
+
+    kwargs = {"params": {"date": "2024-01-16"}}
+    assert client._add_conditional_headers(tuesday, kwargs) is None
+    assert "headers" not in kwargs
+
+    # The cache is bounded; the least recently used entry goes first
+    for day in range(VALIDATOR_CACHE_SIZE):
+        key = client._validator_key("calendar", {"date": day})
+        await client._read_response(key, FakeResponse(200, {"ETag": "x"}, {}), None)
+    assert len(client._validator_cache) == VALIDATOR_CACHE_SIZE
+    assert monday not in client._validator_cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(monkeypatch):
+    """Test that simultaneous GETs for the same endpoint are coalesced."""
+    client = MockClient()
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint))
+        await asyncio.sleep(0.01)
+        return {"endpoint": endpoint}
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+    first, second, other = await asyncio.gather(
+        client.get("quote", params={"a": 1}),
+        client.get("quote", params={"a": 1}),
+        client.get("quote", params={"a": 2}),
+    )
+
+    assert first is second
+    assert len(calls) == 2
+    assert not client._inflight
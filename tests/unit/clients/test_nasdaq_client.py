@@ -5,6 +5,8 @@ from datetime import datetime
 from src.clients.nasdaq_client import NASDAQClient
 from src.utils.date_utils import TradingCalendar
 
+pytestmark = pytest.mark.usefixtures("mock_apis")
+
 
 @pytest.mark.asyncio
 async def test_get_earnings_calendar(mock_nasdaq_data, monkeypatch):
@@ -42,3 +44,26 @@ async def test_nasdaq_client_validate_symbol(monkeypatch):
         assert await client.validate_symbol("AAPL") is True
         # Test invalid symbol
         assert await client.validate_symbol("INVALID") is False
+
+
+@pytest.mark.asyncio
+async def test_nasdaq_client_validate_symbols(monkeypatch):
+    """Test batch symbol validation."""
+    async with NASDAQClient() as client:
+
+        async def mock_get_company_info(symbol):
+            if symbol == "AAPL":
+                return {"status": "Active"}
+            return None
+
+        monkeypatch.setattr(client, "get_company_info", mock_get_company_info)
+        monkeypatch.setattr(client, "is_test", False)
+
+        assert await client.validate_symbols(["AAPL", "INVALID", "AAPL"]) == {
+            "AAPL": True,
+            "INVALID": False,
+        }
+        assert await client.get_company_info_many(["AAPL", "INVALID"]) == {
+            "AAPL": {"status": "Active"},
+            "INVALID": None,
+        }
@@ -1,48 +1,60 @@
 import pytest
+from unittest.mock import AsyncMock, Mock
+
+from aiohttp import ClientResponseError
 from src.clients.sec_client import SECClient
-from src.utils.exceptions import APIError
+from src.utils.exceptions import APIError, RateLimitError
 from src.clients.base_client import settings
 
+pytestmark = pytest.mark.usefixtures("mock_apis")
 
-@pytest.mark.asyncio
-async def test_get_company_tickers():
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_company_tickers(sec_client):
     """Test fetching company tickers from SEC."""
-    async with SECClient() as client:
-        response = await client.get_company_tickers()
-        assert isinstance(response, dict)
-        assert "0" in response
-        # Convert response CIK to string format for comparison
-        response_cik = str(response["0"]["cik_str"]).zfill(10)
-        assert response_cik == "0000320193"
-        assert response["0"]["ticker"] == "AAPL"
+    response = await sec_client.get_company_tickers()
+    assert isinstance(response, dict)
+    assert "0" in response
+    # Convert response CIK to string format for comparison
+    response_cik = str(response["0"]["cik_str"]).zfill(10)
+    assert response_cik == "0000320193"
+    assert response["0"]["ticker"] == "AAPL"
 
 
 @pytest.mark.asyncio
 async def test_validate_cik(monkeypatch):
     """Test CIK validation."""
-    async with SECClient() as client:
+    # Private client: validate_cik memoizes results on the instance
+    sec_client = SECClient()
+    valid_mock = AsyncMock(return_value={"valid": "response"})
+    invalid_mock = AsyncMock(side_effect=APIError("Invalid CIK"))
 
-        async def mock_valid_facts(*args, **kwargs):
-            return {"valid": "response"}
+    monkeypatch.setattr(sec_client, "get_company_facts", valid_mock)
+    assert await sec_client.validate_cik("0000320193") == True
+    valid_mock.assert_awaited_once()
 
-        async def mock_invalid_facts(*args, **kwargs):
-            raise APIError("Invalid CIK")
+    monkeypatch.setattr(sec_client, "get_company_facts", invalid_mock)
+    assert await sec_client.validate_cik("invalid") == False
 
-        monkeypatch.setattr(client, "get_company_facts", mock_valid_facts)
-        assert await client.validate_cik("0000320193") == True
 
-        monkeypatch.setattr(client, "get_company_facts", mock_invalid_facts)
-        assert await client.validate_cik("invalid") == False
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("320193", "0000320193"),
+        ("0000320193", "0000320193"),
+    ],
+)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_format_cik(sec_client, raw, expected):
+    """Test CIK formatting."""
+    assert sec_client.format_cik(raw) == expected
 
 
-@pytest.mark.asyncio
-async def test_format_cik():
-    """Test CIK formatting."""
-    async with SECClient() as client:
-        assert client.format_cik("320193") == "0000320193"
-        assert client.format_cik("0000320193") == "0000320193"
-        with pytest.raises(ValueError):
-            client.format_cik("invalid")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_format_cik_rejects_invalid(sec_client):
+    """Test that a non-numeric CIK raises an error."""
+    with pytest.raises(ValueError):
+        sec_client.format_cik("invalid")
 
 
 @pytest.mark.asyncio
@@ -55,14 +67,135 @@ async def test_client_cleanup():
     assert client._session is None
 
 
-@pytest.mark.asyncio
-async def test_client_error_handling(monkeypatch):
+@pytest.fixture
+def fast_fail_settings(monkeypatch):
+    """Client settings that fail on the first error without backing off."""
+    # Settings are frozen, so swap in a modified copy
+    fast = settings.model_copy(
+        update={
+            "MAX_RETRIES": 1,
+            "RETRY_BACKOFF_FACTOR": 0,
+            "REQUEST_TIMEOUT_SECONDS": 1,
+        }
+    )
+    monkeypatch.setattr("src.clients.base_client.settings", fast)
+    return fast
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_client_error_handling(sec_client, fast_fail_settings):
     """Test error handling in client operations."""
-    # Reduce retries and backoff for the test
-    monkeypatch.setattr(settings, "MAX_RETRIES", 1)
-    monkeypatch.setattr(settings, "RETRY_BACKOFF_FACTOR", 0)
+    with pytest.raises(APIError, match=r"^Request to"):
+        await sec_client.get("invalid-endpoint")
+
+
+@pytest.mark.asyncio
+async def test_company_tickers_are_memoized(monkeypatch):
+    """Test that company tickers are fetched once per client."""
+    async with SECClient() as client:
+        calls = []
+
+        async def mock_get(endpoint, **kwargs):
+            calls.append(endpoint)
+            return {"0": {"cik_str": 320193, "ticker": "AAPL"}}
+
+        monkeypatch.setattr(client, "get", mock_get)
+        first = await client.get_company_tickers()
+        second = await client.get_company_tickers()
+
+        assert first is second
+        assert calls == ["files/company_tickers.json"]
+
+
+@pytest.mark.asyncio
+async def test_stream_company_facts_keeps_requested_concepts(monkeypatch):
+    """Test that only requested us-gaap concepts are decoded."""
+    body = (
+        b'{"cik": 320193, "facts": {"us-gaap": {'
+        b'"Revenues": {"units": {"USD": [1]}}, '
+        b'"EarningsPerShareBasic": {"units": {"USD/shares": [1.5]}}, '
+        b'"Assets": {"units": {"USD": [2]}}}}}'
+    )
+
+    class FakeContent:
+        def __init__(self, data):
+            self._data = data
+
+        async def read(self, size=-1):
+            size = len(self._data) if size < 0 else size
+            chunk, self._data = self._data[:size], self._data[size:]
+            return chunk
+
+    class FakeResponse:
+        def __init__(self):
+            self.content = FakeContent(body)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
 
     async with SECClient() as client:
-        with pytest.raises(APIError) as exc_info:
-            await client.get("invalid-endpoint")
-        assert "Request to" in str(exc_info.value)
+        monkeypatch.setattr(
+            client._session,
+            "request",
+            lambda method, url, **kwargs: FakeResponse(),
+            raising=False,
+        )
+        facts = await client.stream_company_facts(
+            "0000320193", {"EarningsPerShareBasic"}
+        )
+
+    assert facts == {"EarningsPerShareBasic": {"units": {"USD/shares": [1.5]}}}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ticker_lookup_maps(sec_client):
+    """Test ticker <-> CIK lookups built from the tickers file."""
+    await sec_client.get_company_tickers()
+    assert sec_client.cik_for_ticker("aapl") == "0000320193"
+    assert sec_client.ticker_for_cik("0001018724") == "AMZN"
+    assert sec_client.cik_for_ticker("MISSING") is None
+
+
+@pytest.mark.parametrize(
+    "status, error_type, retry_after",
+    [(429, RateLimitError, 7.0), (503, APIError, None)],
+)
+@pytest.mark.asyncio
+async def test_stream_company_facts_backs_off_on_overload(
+    monkeypatch, status, error_type, retry_after
+):
+    """Test that an overloaded stream halves concurrency like other requests."""
+    monkeypatch.setattr(
+        "src.clients.base_client.settings",
+        settings.model_copy(update={"MAX_RETRIES": 1}),
+    )
+
+    class OverloadedResponse:
+        async def __aenter__(self):
+            raise ClientResponseError(
+                Mock(real_url="https://data.sec.gov"),
+                (),
+                status=status,
+                headers={"Retry-After": "7"},
+            )
+
+        async def __aexit__(self, *args):
+            pass
+
+    async with SECClient() as client:
+        starting = client._concurrency
+        monkeypatch.setattr(
+            client._session,
+            "request",
+            lambda method, url, **kwargs: OverloadedResponse(),
+            raising=False,
+        )
+        with pytest.raises(APIError) as excinfo:
+            await client.stream_company_facts("0000320193", {"Assets"})
+
+    assert client._concurrency == max(1.0, starting / 2)
+    assert type(excinfo.value) is error_type
+    assert getattr(excinfo.value, "retry_after", None) == retry_after
@@ -1,25 +1,31 @@
 import pytest
 from src.models.company import Company, Exchange, CompanyStatus
 
+VALID_DATA = {
+    "cik": "0000320193",
+    "symbol": "AAPL",
+    "name": "Apple Inc.",
+    "exchange": Exchange.NASDAQ,
+    "status": CompanyStatus.ACTIVE,
+}
 
-def test_company_model_validation():
+
+@pytest.mark.parametrize(
+    "override, expected_symbol",
+    [
+        ({}, "AAPL"),
+        # Symbol normalization
+        ({"symbol": "AAPL-B"}, "AAPL.B"),
+    ],
+)
+def test_company_model_validation(override, expected_symbol):
     """Test company model validation."""
-    # Valid company data
-    valid_data = {
-        "cik": "0000320193",
-        "symbol": "AAPL",
-        "name": "Apple Inc.",
-        "exchange": Exchange.NASDAQ,
-        "status": CompanyStatus.ACTIVE,
-    }
-    company = Company(**valid_data)
+    company = Company(**{**VALID_DATA, **override})
     assert company.cik == "0000320193"
-    assert company.symbol == "AAPL"
+    assert company.symbol == expected_symbol
 
-    # Test symbol normalization
-    company = Company(**{**valid_data, "symbol": "AAPL-B"})
-    assert company.symbol == "AAPL.B"
 
-    # Invalid CIK should raise error
-    with pytest.raises(ValueError):
-        Company(**{**valid_data, "cik": "123"})
+def test_company_model_rejects_invalid_cik():
+    """Test that an invalid CIK raises an error."""
+    with pytest.raises(ValueError, match="cik"):
+        Company(**{**VALID_DATA, "cik": "123"})
@@ -1,17 +1,35 @@
 import pytest
 from decimal import Decimal
 from datetime import datetime
-from src.models.earnings import EarningsReport, MarketSession, EarningsStatus
+from src.models.base import ingest_timestamp
+from src.models.earnings import (
+    EarningsBatch,
+    EarningsReport,
+    EarningsStatus,
+    MarketSession,
+)
 
+FIXED_NOW = datetime(2024, 1, 16, 9, 30)
+EPS_EST = Decimal("1.43")
+EPS_ACT = Decimal("1.52")
 
-def test_earnings_report_model():
+
+@pytest.mark.parametrize(
+    "eps_estimate, eps_actual, expected_surprise",
+    [
+        (EPS_EST, EPS_ACT, Decimal("0.09")),
+        (Decimal("2.00"), Decimal("1.75"), Decimal("-0.25")),
+        (EPS_EST, None, None),
+    ],
+)
+def test_earnings_report_model(eps_estimate, eps_actual, expected_surprise):
     """Test earnings report model."""
     data = {
         "company_cik": "0000320193",
         "symbol": "AAPL",
-        "report_date": datetime.now(),
-        "eps_estimate": Decimal("1.43"),
-        "eps_actual": Decimal("1.52"),
+        "report_date": FIXED_NOW,
+        "eps_estimate": eps_estimate,
+        "eps_actual": eps_actual,
         "market_session": MarketSession.AFTER_MARKET,
         "status": EarningsStatus.REPORTED,
     }
@@ -19,4 +37,53 @@ def test_earnings_report_model():
     # Create a copy and calculate surprises
     report.calculate_surprises()
     assert report.company_cik == "0000320193"
-    assert report.eps_surprise == Decimal("0.09")
+    assert report.eps_surprise == expected_surprise
+
+
+def test_earnings_batch_summarize():
+    """Test vectorized summary over a batch of calendar rows."""
+    rows = [
+        {
+            "symbol": "aapl",
+            "date": "2024-01-02",
+            "eps_estimate": "1.0",
+            "eps_actual": "1.5",
+        },
+        {
+            "symbol": "AAPL",
+            "date": "2024-04-02",
+            "eps_estimate": "2.0",
+            "eps_actual": "1.0",
+        },
+        {"symbol": "AAPL", "date": "2024-07-02", "eps_estimate": "1.0"},
+        {
+            "symbol": "MSFT",
+            "date": "2024-01-03",
+            "eps_estimate": "1.0",
+            "eps_actual": "2.0",
+        },
+    ]
+    batch = EarningsBatch.from_rows(rows)
+    assert len(batch) == 4
+
+    summary = batch.summarize("AAPL", datetime(2024, 1, 1), datetime(2024, 12, 31))
+    assert summary.total_reports == 3
+    assert summary.beat_estimates == 1
+    assert summary.missed_estimates == 1
+    assert summary.average_surprise == Decimal("-0.25")
+
+
+def test_reports_share_ingest_timestamp():
+    """Test that models built in one ingest share a UTC created_at."""
+    data = {
+        "company_cik": "0000320193",
+        "symbol": "AAPL",
+        "report_date": datetime(2024, 1, 2),
+    }
+    with ingest_timestamp() as now:
+        first = EarningsReport(**data)
+        second = EarningsReport.from_trusted_dict(data)
+
+    assert first.created_at == second.created_at == now
+    assert now.tzinfo is not None
+    assert EarningsReport(**data).created_at != now
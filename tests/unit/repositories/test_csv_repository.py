@@ -2,6 +2,7 @@ import pytest
 from pathlib import Path
 from src.models.company import Company
 from src.repositories.csv_repository import CSVRepository
+from src.utils.exceptions import StorageError
 
 
 @pytest.fixture
@@ -13,17 +14,111 @@ def temp_repository(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_csv_repository_operations(temp_repository):
+async def test_csv_repository_operations(temp_repository, apple_company):
     """Test basic repository operations."""
     # Test adding
-    company = Company(cik="0000320193", symbol="AAPL", name="Apple Inc.")
-    await temp_repository.add(company)
+    await temp_repository.add(apple_company)
 
     # Test retrieval
     retrieved = await temp_repository.get("0000320193")
     assert retrieved is not None
     assert retrieved.symbol == "AAPL"
 
-    # Test deletion
+    # Test deletion; the cached key set answers without reading rows
     assert await temp_repository.delete("0000320193") == True
-    assert await temp_repository.get("0000320193") is None
+    assert not await temp_repository.exists("0000320193")
+
+
+@pytest.mark.asyncio
+async def test_csv_repository_appends_rows(temp_repository, apple_company):
+    """Test that inserts append to the file and reject existing keys."""
+    await temp_repository.add(apple_company)
+    await temp_repository.add_many(
+        [Company(cik="0000789019", symbol="MSFT", name="Microsoft Corp.")]
+    )
+
+    lines = temp_repository.file_path.read_text().splitlines()
+    assert len(lines) == 3
+    assert "0000320193,AAPL" in lines[1]
+
+    with pytest.raises(StorageError):
+        await temp_repository.add_many([apple_company])
+    assert len(await temp_repository.get_all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_csv_repository_sees_other_writers(temp_repository, apple_company):
+    """Test that cached keys are dropped when another writer changes the file."""
+    other = CSVRepository(
+        file_path=temp_repository.file_path, model_class=Company, key_field="cik"
+    )
+    assert not await temp_repository.exists("0000320193")
+
+    await other.add(apple_company)
+
+    assert await temp_repository.exists("0000320193")
+    with pytest.raises(StorageError):
+        await temp_repository.add(apple_company)
+
+
+@pytest.mark.asyncio
+async def test_csv_repository_offset_index(tmp_path, monkeypatch, apple_company):
+    """Test that offset mode seeks to rows instead of scanning the file."""
+    repository = CSVRepository(
+        file_path=tmp_path / "test.csv",
+        model_class=Company,
+        key_field="cik",
+        index_mode="offset",
+    )
+    await repository.add_many(
+        [
+            Company(cik=str(cik).zfill(10), symbol=f"S{cik}", name=f"Co {cik}")
+            for cik in range(1, 2001)
+        ]
+    )
+    assert (await repository.get("0000001000")).symbol == "S1000"
+
+    # Appends extend the index; lookups no longer scan rows
+    await repository.add(apple_company)
+    monkeypatch.setattr(
+        repository, "_scan_for_key", lambda key: pytest.fail("scanned for key")
+    )
+    assert (await repository.get("0000320193")).symbol == "AAPL"
+    assert (await repository.get("0000002000")).symbol == "S2000"
+    assert await repository.get("0000999999") is None
+
+    # Rewrites drop the index and it is rebuilt from the new file
+    assert await repository.delete("0000001000")
+    assert await repository.get("0000001000") is None
+    assert await repository.exists("0000001001")
+
+    with pytest.raises(ValueError):
+        CSVRepository(
+            file_path=tmp_path / "other.csv",
+            model_class=Company,
+            key_field="cik",
+            index_mode="btree",
+        )
+
+
+@pytest.mark.asyncio
+async def test_csv_repository_memory_mapped_scans(tmp_path, monkeypatch, apple_company):
+    """Test that large-file scans and the offset index work over mmap."""
+    monkeypatch.setattr("src.repositories.csv_repository.MMAP_THRESHOLD_BYTES", 1)
+    repository = CSVRepository(
+        file_path=tmp_path / "test.csv",
+        model_class=Company,
+        key_field="cik",
+        index_mode="offset",
+    )
+    await repository.add_many(
+        [
+            apple_company,
+            Company(cik="0000789019", symbol="MSFT", name="Microsoft Corp."),
+        ]
+    )
+
+    assert (await repository.get("0000789019")).symbol == "MSFT"
+    assert await repository.delete("0000320193")
+    assert await repository.get("0000320193") is None
+    assert [company.symbol for company in await repository.get_all()] == ["MSFT"]
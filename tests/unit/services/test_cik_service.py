@@ -1,26 +1,51 @@
 """Tests for CIK service."""
 
+import asyncio
+
 import pytest
-from src.clients.sec_client import SECClient
-from src.models.company import Company
-from src.repositories.csv_repository import CSVRepository
-from src.services.cik_service import CIKService
 
+pytestmark = pytest.mark.usefixtures("mock_apis")
 
-@pytest.mark.asyncio
-async def test_cik_service(mock_sec_response, tmp_path):
-    """Test CIK service operations."""
-    repository = CSVRepository(
-        file_path=tmp_path / "companies.csv", model_class=Company, key_field="cik"
-    )
-    service = CIKService(SECClient(), repository)
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cik_service(cik_service):
+    """Test CIK service operations."""
     # Test updating company list
-    new_symbols = await service.update_company_list()
+    new_symbols = await cik_service.update_company_list()
     assert len(new_symbols) > 0
     assert "AAPL" in new_symbols
 
     # Test getting company
-    company = await service.get_company("AAPL")
+    company = await cik_service.get_company("AAPL")
+    assert company is not None
+    assert company.cik == "0000320193"
+
+    # Test bulk lookup skips unknown symbols
+    ciks = await cik_service.get_ciks_bulk(["aapl", "UNKNOWN"])
+    assert ciks == {"aapl": "0000320193"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_lookup_waits_for_company_update(cik_service, monkeypatch):
+    """Lookups made during an update see the refreshed company list."""
+    await cik_service.get_company("AAPL")  # prime the cache before the update
+
+    release = asyncio.Event()
+    fetch_tickers = cik_service.sec_client.get_company_tickers
+
+    async def slow_tickers():
+        await release.wait()
+        return await fetch_tickers()
+
+    monkeypatch.setattr(cik_service.sec_client, "get_company_tickers", slow_tickers)
+
+    update = asyncio.create_task(cik_service.update_company_list())
+    await asyncio.sleep(0)  # let the update take the cache lock
+    lookup = asyncio.create_task(cik_service.get_company("AAPL"))
+    await asyncio.sleep(0)
+    release.set()
+    await update
+
+    company = await lookup
     assert company is not None
     assert company.cik == "0000320193"
@@ -1,116 +1,183 @@
+import asyncio
+import shutil
+
 import pytest
 from datetime import datetime, time
 from decimal import Decimal
 from unittest.mock import AsyncMock
-from src.clients.sec_client import SECClient
-from src.models.company import Company, Exchange, CompanyStatus
+from src.models.company import Company
 from src.repositories.csv_repository import CSVRepository
-from src.services.earnings_service import EarningsService
+from src.services.earnings_service import EarningsService, _parse_earnings_rows
 from src.clients.nasdaq_client import NASDAQClient
+from src.clients.sec_client import SECClient
 from src.services.cik_service import CIKService
 from src.repositories.earnings_repository import EarningsRepository
 from src.models.earnings import EarningsReport, MarketSession, EarningsStatus
-from src.utils.date_utils import TradingCalendar
+
+pytestmark = pytest.mark.usefixtures("mock_apis")
+
+# Fixed market-hours timestamp on a real trading day (Tuesday), so the
+# trading calendar needs no stubbing
+FIXED_NOW = datetime(2024, 1, 16, 9, 30)
+EPS_EST = Decimal("1.43")
+EPS_ACT = Decimal("1.52")
+
+
+MOCK_EARNINGS_DATA = {
+    "data": {
+        "rows": [
+            {
+                "symbol": "AAPL",
+                "date": FIXED_NOW.strftime("%Y-%m-%d"),
+                "time": "16:30",
+                "eps_estimate": "1.43",
+                "eps_actual": "1.52",
+            }
+        ]
+    }
+}
+
+# Parsed once; enrichment tests start from typed rows
+PARSED_ROWS = _parse_earnings_rows(
+    MOCK_EARNINGS_DATA["data"]["rows"]
+    + [{"symbol": "ZZZZ", "date": FIXED_NOW.strftime("%Y-%m-%d")}]
+)
 
 
 @pytest.fixture
 def mock_earnings_data():
     """Mock earnings data fixture."""
-    return {
-        "data": {
-            "rows": [
-                {
-                    "symbol": "AAPL",
-                    "date": datetime.now().strftime("%Y-%m-%d"),
-                    "time": "16:30",
-                    "eps_estimate": "1.43",
-                    "eps_actual": "1.52",
-                }
-            ]
-        }
-    }
+    return MOCK_EARNINGS_DATA
 
 
-@pytest.fixture
-def mock_trading_calendar(monkeypatch):
-    """Mock trading calendar to always return True for is_trading_day."""
+@pytest.fixture(scope="module")
+def seeded_companies_csv(tmp_path_factory, apple_company):
+    """Write the company CSV with the test companies once per module."""
+    file_path = tmp_path_factory.mktemp("repo") / "companies.csv"
+    repository = CSVRepository(
+        file_path=file_path, model_class=Company, key_field="cik"
+    )
+
+    # Add test companies in one append
+    test_companies = [apple_company]
+    asyncio.run(repository.add_many(test_companies))
+    return file_path
 
-    def mock_is_trading_day(*args, **kwargs):
-        return True
 
-    monkeypatch.setattr(TradingCalendar, "is_trading_day", mock_is_trading_day)
+@pytest.fixture
+def company_repository(tmp_path, seeded_companies_csv):
+    """Company repository over a per-test copy of the seeded file."""
+    company_file = tmp_path / "companies.csv"
+    shutil.copyfile(seeded_companies_csv, company_file)
+    return CSVRepository(file_path=company_file, model_class=Company, key_field="cik")
 
 
 @pytest.fixture
-async def test_service(
-    tmp_path, monkeypatch, mock_earnings_data, mock_trading_calendar
-):
+async def test_service(tmp_path, monkeypatch, company_repository):
     """Create a test earnings service with mocked dependencies."""
-    # Create and configure repositories
-    company_repository = CSVRepository(
-        file_path=tmp_path / "companies.csv", model_class=Company, key_field="cik"
-    )
-
-    # Add test company
-    test_company = Company(
-        cik="0000320193",
-        symbol="AAPL",
-        name="Apple Inc.",
-        exchange=Exchange.NASDAQ,
-        status=CompanyStatus.ACTIVE,
-    )
-    await company_repository.add(test_company)
+    # Per-test SEC client: the session-scoped one is bound to the session loop
+    cik_service = CIKService(SECClient(), company_repository)
 
     # Configure mock NASDAQ client
     nasdaq_client = NASDAQClient()
 
-    async def mock_get_earnings(*args, **kwargs):
-        return mock_earnings_data
-
-    monkeypatch.setattr(nasdaq_client, "get_earnings_calendar", mock_get_earnings)
+    monkeypatch.setattr(
+        nasdaq_client,
+        "get_earnings_calendar",
+        AsyncMock(return_value=MOCK_EARNINGS_DATA),
+    )
 
     # Create service with mocked components
     service = EarningsService(
         nasdaq_client,
-        CIKService(SECClient(), company_repository),
+        cik_service,
         EarningsRepository(base_dir=tmp_path / "earnings"),
     )
 
     return service
 
 
+def assert_apple_report(reports):
+    """Check that reports hold exactly the mocked AAPL row."""
+    assert len(reports) == 1
+    assert reports[0].symbol == "AAPL"
+    assert reports[0].eps_estimate == EPS_EST
+    assert reports[0].eps_actual == EPS_ACT
+
+
 @pytest.mark.asyncio
 async def test_fetch_daily_earnings(test_service):
-    """Test fetching daily earnings."""
-    date = datetime.now().replace(hour=9, minute=30)  # Market hours
-    reports = await test_service.fetch_daily_earnings(date)
-    assert len(reports) > 0
-    assert reports[0].symbol == "AAPL"
-    assert reports[0].eps_estimate == Decimal("1.43")
+    """Test fetching earnings for one day."""
+    reports = await test_service.fetch_daily_earnings(FIXED_NOW)
+    assert_apple_report(reports)
 
 
 @pytest.mark.asyncio
 async def test_update_earnings_data(test_service):
-    """Test updating earnings data for a date range."""
-    start_date = datetime.now().replace(hour=9, minute=30)  # Market hours
-    end_date = start_date
-    results = await test_service.update_earnings_data(start_date, end_date)
-    assert len(results) > 0
-    assert start_date in results
-    assert results[start_date] > 0
+    """Test updating earnings over a date range."""
+    results = await test_service.update_earnings_data(FIXED_NOW, FIXED_NOW)
+    assert FIXED_NOW in results
+    assert results[FIXED_NOW] > 0
 
 
 @pytest.mark.asyncio
 async def test_process_earnings_data(test_service, mock_earnings_data):
-    """Test processing raw earnings data."""
+    """Test processing a raw earnings payload."""
     reports = await test_service._process_earnings_data(mock_earnings_data)
-    assert len(reports) == 1
-    assert reports[0].symbol == "AAPL"
-    assert reports[0].eps_estimate == Decimal("1.43")
-    assert reports[0].eps_actual == Decimal("1.52")
+    assert_apple_report(reports)
+
+
+@pytest.mark.asyncio
+async def test_enrich_reports_skips_unknown_symbols(test_service):
+    """Test building reports from pre-parsed rows without re-parsing."""
+    reports = await test_service._enrich_reports(PARSED_ROWS)
+    assert [report.symbol for report in reports] == ["AAPL"]
+    assert reports[0].company_cik == "0000320193"
+    assert reports[0].eps_surprise == EPS_ACT - EPS_EST
+    assert await test_service._enrich_reports(PARSED_ROWS.iloc[0:0]) == []
 
 
-def test_clean_shutdown(test_service):
-    """Ensure clean shutdown of services."""
-    # This test helps ensure we're properly cleaning up resources
-    pass
+@pytest.mark.asyncio
+async def test_process_earnings_data_skips_unparseable_numbers(test_service):
+    """Test that one non-numeric value only drops its own row."""
+    raw = {
+        "data": {
+            "rows": MOCK_EARNINGS_DATA["data"]["rows"]
+            + [
+                {
+                    "symbol": "AAPL",
+                    "date": FIXED_NOW.strftime("%Y-%m-%d"),
+                    "eps_estimate": "N/A",
+                }
+            ]
+        }
+    }
+    reports = await test_service._process_earnings_data(raw)
+    assert [report.eps_estimate for report in reports] == [EPS_EST]
+
+
+@pytest.mark.parametrize(
+    "bad_fields",
+    [
+        {"symbol": "AAPLAAPLAAPL"},
+        {"eps_actual": "NaN"},
+        {"revenue_estimate": "Infinity"},
+    ],
+)
+def test_parse_earnings_rows_drops_rows_reports_would_reject(bad_fields):
+    """Test that rows failing EarningsReport's constraints never reach it."""
+    good = MOCK_EARNINGS_DATA["data"]["rows"][0]
+    parsed = _parse_earnings_rows([good, {**good, **bad_fields}])
+    assert parsed["symbol"].tolist() == ["AAPL"]
+    assert parsed["eps_actual"].tolist() == [EPS_ACT]
+
+
+@pytest.mark.asyncio
+async def test_earnings_summary_queries_normalized_symbol(test_service, monkeypatch):
+    """Test that spellings of one symbol share a cache entry and a query."""
+    get_summary = AsyncMock(return_value=None)
+    monkeypatch.setattr(test_service.repository, "get_summary", get_summary)
+
+    await test_service.get_earnings_summary("BRK-B", FIXED_NOW, FIXED_NOW)
+    await test_service.get_earnings_summary("BRK.B", FIXED_NOW, FIXED_NOW)
+    get_summary.assert_awaited_once_with("BRK.B", FIXED_NOW, FIXED_NOW)